@@ -1,5 +1,6 @@
 """Demo script to generate mounting bracket STEP and DXF files."""
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from src.cad_automation.templates.mounting_bracket import (
@@ -8,58 +9,68 @@ from src.cad_automation.templates.mounting_bracket import (
 )
 
 
-def main():
-    """Generate example mounting brackets."""
-    # Create output directory
-    output_dir = Path("outputs")
-    output_dir.mkdir(exist_ok=True)
+def _build_one(params: MountingBracketParams, output_dir: Path) -> list[Path]:
+    """Generate and export STEP + DXF for one bracket (runs in a worker process).
 
-    # Initialize template
-    template = MountingBracketTemplate()
+    Args:
+        params: Mounting bracket parameters
+        output_dir: Directory to write output files to
 
-    # Example 1: L-bracket
-    print("Generating L-bracket...")
-    l_bracket_params = MountingBracketParams(
-        width=100.0,
-        height=80.0,
-        thickness=5.0,
-        hole_diameter=8.0,
-        hole_count=4,
-        material="Steel",
-        bracket_type="L",
-    )
+    Returns:
+        Paths of the exported files
+    """
+    template = MountingBracketTemplate()
+    stem = f"{params.bracket_type.lower()}_bracket"
 
     # Generate 3D model
-    l_bracket_3d = template.generate_3d(l_bracket_params)
-    template.export_step(l_bracket_3d, output_dir / "l_bracket.step")
-    print(f"  ✓ Exported: {output_dir / 'l_bracket.step'}")
+    step_path = output_dir / f"{stem}.step"
+    template.export_step(template.generate_3d(params), step_path)
 
     # Generate 2D drawing
-    l_bracket_2d = template.generate_2d(l_bracket_params)
-    template.export_dxf(l_bracket_2d, output_dir / "l_bracket.dxf")
-    print(f"  ✓ Exported: {output_dir / 'l_bracket.dxf'}")
-
-    # Example 2: Flat bracket
-    print("\nGenerating flat bracket...")
-    flat_bracket_params = MountingBracketParams(
-        width=120.0,
-        height=60.0,
-        thickness=3.0,
-        hole_diameter=6.0,
-        hole_count=6,
-        material="Aluminum",
-        bracket_type="flat",
-    )
+    dxf_path = output_dir / f"{stem}.dxf"
+    template.export_dxf(template.generate_2d(params), dxf_path)
 
-    # Generate 3D model
-    flat_bracket_3d = template.generate_3d(flat_bracket_params)
-    template.export_step(flat_bracket_3d, output_dir / "flat_bracket.step")
-    print(f"  ✓ Exported: {output_dir / 'flat_bracket.step'}")
+    return [step_path, dxf_path]
 
-    # Generate 2D drawing
-    flat_bracket_2d = template.generate_2d(flat_bracket_params)
-    template.export_dxf(flat_bracket_2d, output_dir / "flat_bracket.dxf")
-    print(f"  ✓ Exported: {output_dir / 'flat_bracket.dxf'}")
+
+def main():
+    """Generate example mounting brackets."""
+    # Create output directory
+    output_dir = Path("outputs")
+    output_dir.mkdir(exist_ok=True)
+
+    bracket_params = [
+        # Example 1: L-bracket
+        MountingBracketParams(
+            width=100.0,
+            height=80.0,
+            thickness=5.0,
+            hole_diameter=8.0,
+            hole_count=4,
+            material="Steel",
+            bracket_type="L",
+        ),
+        # Example 2: Flat bracket
+        MountingBracketParams(
+            width=120.0,
+            height=60.0,
+            thickness=3.0,
+            hole_diameter=6.0,
+            hole_count=6,
+            material="Aluminum",
+            bracket_type="flat",
+        ),
+    ]
+
+    # Brackets are independent, so build them in parallel. OCCT state is not
+    # thread-safe, hence processes rather than threads.
+    print(f"Generating {len(bracket_params)} brackets...")
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(_build_one, bracket_params, [output_dir] * len(bracket_params))
+        for params, paths in zip(bracket_params, results):
+            print(f"\n{params.bracket_type} bracket:")
+            for path in paths:
+                print(f"  ✓ Exported: {path}")
 
     print("\n✓ All files generated successfully!")
     print(f"\nOutput directory: {output_dir.absolute()}")
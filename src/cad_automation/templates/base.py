@@ -1,12 +1,69 @@
 """Base template abstract class for parametric CAD generation."""
 
+from __future__ import annotations
+
+import os
+import tempfile
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from build123d import Part, export_step
 from ezdxf.document import Drawing
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    # Imported lazily at runtime - build123d/OCCT take seconds to load
+    from build123d import Part
+
+# Output buffer size for DXF export (bytes)
+DXF_WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# Resolved output directories already created by this process (skips repeated mkdir),
+# least recently used first
+_mkdir_cache: OrderedDict[Path, None] = OrderedDict()
+_MKDIR_CACHE_SIZE = 256
+
+
+def _ensure_dir(directory: Path) -> None:
+    """Create a resolved directory unless this process already created it."""
+    if directory in _mkdir_cache:
+        _mkdir_cache.move_to_end(directory)
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    _mkdir_cache[directory] = None
+    if len(_mkdir_cache) > _MKDIR_CACHE_SIZE:
+        _mkdir_cache.popitem(last=False)
+
+
+def _atomic_write(path: Path, write: Callable[[Path], None]) -> None:
+    """Write path via a temporary sibling that atomically replaces it on success.
+
+    Readers never see a partially written file, and a failed export leaves
+    any previous output intact. Parent directories are created as needed.
+
+    Args:
+        path: Output file path
+        write: Writes the output to the temporary path it is given
+    """
+    directory = path.parent.resolve()
+    _ensure_dir(directory)
+    tmp_path = directory / (path.name + ".tmp")
+    try:
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, directory / path.name)
+        except (OSError, RuntimeError):
+            if directory.is_dir():
+                raise
+            # Directory was removed after it was cached - recreate and retry once
+            directory.mkdir(parents=True, exist_ok=True)
+            write(tmp_path)
+            os.replace(tmp_path, directory / path.name)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
 
 class TemplateParams(BaseModel):
     """Base parameter schema for all templates."""
@@ -46,24 +103,112 @@ class BaseTemplate(ABC):
         """
         pass
 
-    def export_step(self, part: Part, path: Path) -> None:
+    def export_step(self, part: Part, path: Path, compact: bool = False) -> None:
         """Export build123d Part to STEP format.
 
         Args:
             part: build123d Part object
             path: Output file path (.step or .stp)
+            compact: Write a smaller AP203 manifold-solid STEP without p-curves
+                via the OCCT writer directly (faster, roughly half the size)
+        """
+        _atomic_write(Path(path), lambda tmp_path: self._write_step(part, tmp_path, compact))
+
+    def export_step_bytes(self, part: Part, compact: bool = False) -> bytes:
+        """Export build123d Part to STEP and return the file contents.
+
+        For in-memory pipelines (e.g. HTTP responses) that should not keep
+        output files around. OCP does not expose a Python stream for the OCCT
+        STEP writer, so the part is written to a temporary file and read back
+        in a single read.
+
+        Args:
+            part: build123d Part object
+            compact: Use the compact AP203 writer (see export_step)
+
+        Returns:
+            STEP file contents
         """
-        path = Path(path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        export_step(part, str(path))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "part.step"
+            self._write_step(part, path, compact)
+            return path.read_bytes()
+
+    def _write_step(self, part: Part, path: Path, compact: bool) -> None:
+        """Write part to STEP file at path using the selected writer."""
+        if compact:
+            self._export_step_compact(part, path)
+        else:
+            from build123d import export_step
+
+            export_step(part, str(path))
 
-    def export_dxf(self, drawing: Drawing, path: Path) -> None:
+    @staticmethod
+    def _export_step_compact(part: Part, path: Path) -> None:
+        """Write part as compact AP203 STEP using OCCT's STEPControl_Writer.
+
+        Skips surface p-curves and the XCAF name/layer/colour metadata that
+        build123d's exporter emits, which dominate file size for simple parts.
+
+        Raises:
+            RuntimeError: If OCCT fails to transfer or write the shape
+        """
+        from OCP.IFSelect import IFSelect_ReturnStatus
+        from OCP.Interface import Interface_Static
+        from OCP.STEPControl import (
+            STEPControl_Controller,
+            STEPControl_StepModelType,
+            STEPControl_Writer,
+        )
+
+        # Register the STEP statics, then set them before the writer creates its model.
+        # Statics are process-global, so restore them for build123d's default exporter.
+        STEPControl_Controller.Init_s()
+        schema = Interface_Static.CVal_s("write.step.schema")
+        surface_curve_mode = Interface_Static.IVal_s("write.surfacecurve.mode")
+        Interface_Static.SetCVal_s("write.step.schema", "AP203")
+        Interface_Static.SetIVal_s("write.surfacecurve.mode", 0)
+        try:
+            writer = STEPControl_Writer()
+            status = writer.Transfer(
+                part.wrapped, STEPControl_StepModelType.STEPControl_ManifoldSolidBrep
+            )
+            if status != IFSelect_ReturnStatus.IFSelect_RetDone:
+                raise RuntimeError(f"Failed to transfer part to STEP model: {status}")
+
+            status = writer.Write(str(path))
+        finally:
+            Interface_Static.SetCVal_s("write.step.schema", schema)
+            Interface_Static.SetIVal_s("write.surfacecurve.mode", surface_curve_mode)
+
+        if status != IFSelect_ReturnStatus.IFSelect_RetDone:
+            raise RuntimeError(f"Failed to write STEP file {path}: {status}")
+
+    def export_dxf(self, drawing: Drawing, path: Path, binary: bool = False) -> None:
         """Export ezdxf Drawing to DXF format.
 
         Args:
             drawing: ezdxf Drawing object
             path: Output file path (.dxf)
+            binary: Write binary DXF (faster to write and smaller, but not
+                supported by every CAD application)
         """
-        path = Path(path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        drawing.saveas(str(path))
+        _atomic_write(Path(path), lambda tmp_path: self._write_dxf(drawing, tmp_path, binary))
+
+    @staticmethod
+    def _write_dxf(drawing: Drawing, path: Path, binary: bool) -> None:
+        """Write drawing to DXF file at path."""
+        # Large buffer collapses ezdxf's per-tag writes into a handful of syscalls
+        if binary:
+            with open(path, "wb", buffering=DXF_WRITE_BUFFER_SIZE) as fp:
+                drawing.write(fp, fmt="bin")
+        else:
+            # Encoding and "dxfreplace" error handler match Drawing.saveas()
+            with open(
+                path,
+                "w",
+                encoding=drawing.output_encoding,
+                errors="dxfreplace",
+                buffering=DXF_WRITE_BUFFER_SIZE,
+            ) as fp:
+                drawing.write(fp)
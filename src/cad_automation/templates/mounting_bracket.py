@@ -1,113 +1,296 @@
-"""Mounting bracket parametric template - L-bracket and flat bracket variants."""
+"""Mounting bracket parametric template - L-bracket and flat bracket variants.
+
+build123d (and the OCCT kernel behind it) is imported lazily inside the 3D
+generators, so parameter validation and 2D drawing generation do not pay
+its multi-second import cost.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, ClassVar, Literal
 
-from build123d import *
 from ezdxf import new
 from ezdxf.document import Drawing
-from pydantic import Field
+from ezdxf.enums import MTextEntityAlignment
+from ezdxf.math import Vec3
+from pydantic import ConfigDict, Field, field_validator
 
 from .base import BaseTemplate, TemplateParams
 
+if TYPE_CHECKING:
+    from build123d import Part
+
+# AS 1100.101 line thickness standards (mm)
+# Visible outlines: 0.5mm, Hidden lines: 0.25mm, Dimension lines: 0.25mm
+# (name, color, linetype)
+_LAYERS: tuple[tuple[str, int, str], ...] = (
+    ("OUTLINE", 7, "CONTINUOUS"),  # White, solid
+    ("HIDDEN", 8, "DASHED"),  # Grey, dashed
+    ("DIMENSIONS", 3, "CONTINUOUS"),  # Green, solid
+    ("TEXT", 7, "CONTINUOUS"),  # White, solid
+)
+
+# ezdxf resources the drawing references: DASHED linetype, EZDXF dimstyle and
+# its text style. Skips the 25 default visual styles setup=True also creates.
+_DXF_SETUP = ("linetypes", "styles", "dimstyles")
+
+# Case-folded bracket type -> canonical bracket type
+_BRACKET_TYPES = {"l": "L", "flat": "flat"}
+
+
+def _rectangle(
+    x0: float, y0: float, width: float, height: float
+) -> tuple[tuple[float, float], ...]:
+    """Closed rectangle polyline vertices, counter-clockwise from lower left."""
+    x1, y1 = x0 + width, y0 + height
+    return ((x0, y0), (x1, y0), (x1, y1), (x0, y1), (x0, y0))
+
+
+# AS 1100.101 title block location: bottom right corner
+# A4 landscape: 297x210mm, border 20mm left, 10mm others
+# Title block typically 170mm wide x 50mm high
+_TITLE_X = 297 - 170 - 10  # Right aligned with 10mm margin
+_TITLE_Y = 10  # Bottom aligned with 10mm margin
+_TITLE_BLOCK_POINTS = _rectangle(_TITLE_X, _TITLE_Y, 170, 50)
+
 
 class MountingBracketParams(TemplateParams):
     """Parameters for mounting bracket generation.
 
-    Supports L-bracket (90-degree) and flat bracket variants.
+    Supports L-bracket (90-degree) and flat bracket variants. Instances are
+    immutable and hashable, so they can key caches directly.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     width: float = Field(gt=0, description="Bracket width in mm")
     height: float = Field(gt=0, description="Bracket height in mm")
     thickness: float = Field(gt=0, description="Material thickness in mm")
     hole_diameter: float = Field(gt=0, description="Mounting hole diameter in mm")
     hole_count: int = Field(ge=1, le=10, description="Number of mounting holes")
     material: str = Field(default="Steel", description="Material specification")
-    bracket_type: str = Field(
+    bracket_type: Literal["L", "flat"] = Field(
         default="L", description="Bracket type: 'L' for L-bracket, 'flat' for flat"
     )
 
+    @field_validator("bracket_type", mode="before")
+    @classmethod
+    def _normalize_bracket_type(cls, value):
+        """Accept bracket type case-insensitively (e.g. 'l', 'FLAT')."""
+        if isinstance(value, str):
+            return _BRACKET_TYPES.get(value.casefold(), value)
+        return value
+
+
+@dataclass(frozen=True)
+class _Plan:
+    """Derived geometry shared by the 3D and 2D generation paths.
+
+    Attributes:
+        hole_xs: Hole centre x-offsets from the bracket centreline
+        outline: 3D sketch outline (L profile in YZ, or flat plate corners in XY)
+        hole_centers: Hole centres in each plate's sketch plane
+        layers: DXF layer definitions as (name, color, linetype)
+    """
+
+    hole_xs: tuple[float, ...]
+    outline: tuple[tuple[float, float], ...]
+    hole_centers: tuple[tuple[float, float], ...]
+    layers: tuple[tuple[str, int, str], ...]
+
 
 class MountingBracketTemplate(BaseTemplate):
     """Parametric mounting bracket template.
 
     Generates L-brackets and flat brackets with mounting holes.
+
+    Generated parts are kept in a bounded per-instance LRU cache keyed by
+    the (frozen) parameters, so repeated calls with identical parameters
+    skip the OCCT kernel. Drawings are mutable (writing one updates its
+    header), so generate_2d() always returns a fresh drawing; only the
+    derived geometry from prepare() is shared.
     """
 
-    def generate_3d(self, params: MountingBracketParams) -> Part:
-        """Generate 3D L-bracket or flat bracket.
+    # Maximum number of generated parts kept per template instance
+    cache_size = 32
+
+    def __init__(self):
+        """Initialize template with an empty 3D output cache."""
+        self._3d_cache: OrderedDict[MountingBracketParams, Part] = OrderedDict()
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _hole_xs(width: float, count: int) -> tuple[float, ...]:
+        """Hole x-offsets relative to the bracket centreline.
+
+        Shared by the 3D features and 2D views so both always agree.
+
+        Args:
+            width: Bracket width in mm
+            count: Number of equally spaced holes
+
+        Returns:
+            Tuple of hole centre x-offsets in mm
+        """
+        spacing = width / (count + 1)
+        return tuple(-width / 2 + i * spacing for i in range(1, count + 1))
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _l_bracket_coords(
+        width: float, height: float, thickness: float, hole_count: int
+    ) -> tuple[tuple[tuple[float, float], ...], tuple[tuple[float, float], ...]]:
+        """Precompute all L-bracket sketch coordinates in one numeric pass.
+
+        Args:
+            width: Bracket width in mm
+            height: Leg length in mm
+            thickness: Material thickness in mm
+            hole_count: Number of holes per leg
+
+        Returns:
+            Tuple of (L profile vertices in the YZ plane, hole centres in each
+            leg's plane as (x, distance from the corner))
+        """
+        h, t = height, thickness
+        profile = ((0.0, 0.0), (h, 0.0), (h, t), (t, t), (t, h), (0.0, h))
+        # Holes sit midway along the free length of each leg
+        leg_mid = (h + t) / 2
+        holes = tuple((x, leg_mid) for x in MountingBracketTemplate._hole_xs(width, hole_count))
+        return profile, holes
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def prepare(params: MountingBracketParams) -> _Plan:
+        """Compute derived geometry once per parameter set.
 
         Args:
             params: Mounting bracket parameters
 
         Returns:
-            build123d Part object
+            Plan consumed by both generate_3d() and generate_2d()
         """
-        if params.bracket_type.lower() == "l":
-            return self._generate_l_bracket_3d(params)
+        hole_xs = MountingBracketTemplate._hole_xs(params.width, params.hole_count)
+        if params.bracket_type == "L":
+            outline, hole_centers = MountingBracketTemplate._l_bracket_coords(
+                params.width, params.height, params.thickness, params.hole_count
+            )
         else:
-            return self._generate_flat_bracket_3d(params)
+            half_w, half_h = params.width / 2, params.height / 2
+            outline = ((-half_w, -half_h), (half_w, -half_h), (half_w, half_h), (-half_w, half_h))
+            hole_centers = tuple((x, 0.0) for x in hole_xs)
+        return _Plan(hole_xs=hole_xs, outline=outline, hole_centers=hole_centers, layers=_LAYERS)
 
-    def _generate_l_bracket_3d(self, params: MountingBracketParams) -> Part:
-        """Generate 3D L-bracket (90-degree angle)."""
-        with BuildPart() as bracket:
-            # Create vertical plate
-            with BuildSketch():
-                Rectangle(params.width, params.height)
-
-            extrude(amount=params.thickness)
+    def generate_3d(self, params: MountingBracketParams) -> Part:
+        """Generate 3D L-bracket or flat bracket.
 
-            # Create horizontal plate
-            with BuildSketch(Plane.XY.offset(0)):
-                Rectangle(params.width, params.height)
+        Args:
+            params: Mounting bracket parameters
 
-            extrude(amount=params.thickness)
+        Returns:
+            build123d Part object (cached for identical parameters - do not
+            modify the returned part in place)
+        """
+        part = self._3d_cache.get(params)
+        if part is not None:
+            self._3d_cache.move_to_end(params)
+            return part
+
+        generate = self._DISPATCH[params.bracket_type]
+        part = generate(self, params, self.prepare(params))
+        self._3d_cache[params] = part
+        if len(self._3d_cache) > self.cache_size:
+            self._3d_cache.popitem(last=False)  # Evict least recently used
+        return part
+
+    def _generate_l_bracket_3d(self, params: MountingBracketParams, plan: _Plan) -> Part:
+        """Generate 3D L-bracket (90-degree angle).
+
+        Both legs are params.height long and params.thickness thick; the
+        L cross-section lies in the YZ plane and is extruded along X to
+        params.width, centred on the origin.
+        """
+        from build123d import (
+            BuildLine,
+            BuildPart,
+            BuildSketch,
+            Circle,
+            Locations,
+            Mode,
+            Plane,
+            Polyline,
+            extrude,
+            make_face,
+        )
 
-            # Create mounting holes in vertical plate
-            hole_spacing = params.width / (params.hole_count + 1)
-            for i in range(1, params.hole_count + 1):
-                x_pos = -params.width / 2 + i * hole_spacing
-                y_pos = params.height / 2
+        with BuildPart() as bracket:
+            # Create L-shaped profile (horizontal leg along Y, vertical leg along Z)
+            with BuildSketch(Plane.YZ):
+                with BuildLine():
+                    Polyline(*plan.outline, close=True)
+                make_face()
 
-                with BuildSketch(Plane.XY.offset(params.thickness / 2)):
-                    with Locations((x_pos, y_pos)):
-                        Circle(params.hole_diameter / 2)
+            extrude(amount=params.width / 2, both=True)
 
-                extrude(amount=-params.thickness, mode=Mode.SUBTRACT)
+            # Create mounting holes in vertical plate (drilled along Y)
+            with BuildSketch(Plane.XZ):
+                with Locations(*plan.hole_centers):
+                    Circle(params.hole_diameter / 2)
 
-            # Create mounting holes in horizontal plate
-            for i in range(1, params.hole_count + 1):
-                x_pos = -params.width / 2 + i * hole_spacing
-                y_pos = -params.height / 2
+            extrude(amount=params.thickness, both=True, mode=Mode.SUBTRACT)
 
-                with BuildSketch(Plane.XY.offset(params.thickness / 2)):
-                    with Locations((x_pos, y_pos)):
-                        Circle(params.hole_diameter / 2)
+            # Create mounting holes in horizontal plate (drilled along Z)
+            with BuildSketch(Plane.XY):
+                with Locations(*plan.hole_centers):
+                    Circle(params.hole_diameter / 2)
 
-                extrude(amount=-params.thickness, mode=Mode.SUBTRACT)
+            extrude(amount=params.thickness, both=True, mode=Mode.SUBTRACT)
 
         return bracket.part
 
-    def _generate_flat_bracket_3d(self, params: MountingBracketParams) -> Part:
+    def _generate_flat_bracket_3d(self, params: MountingBracketParams, plan: _Plan) -> Part:
         """Generate 3D flat bracket (single plate)."""
+        from build123d import (
+            BuildLine,
+            BuildPart,
+            BuildSketch,
+            Circle,
+            Locations,
+            Mode,
+            Plane,
+            Polyline,
+            extrude,
+            make_face,
+        )
+
         with BuildPart() as bracket:
             # Create flat plate
             with BuildSketch():
-                Rectangle(params.width, params.height)
+                with BuildLine():
+                    Polyline(*plan.outline, close=True)
+                make_face()
 
             extrude(amount=params.thickness)
 
-            # Create mounting holes
-            hole_spacing = params.width / (params.hole_count + 1)
-            for i in range(1, params.hole_count + 1):
-                x_pos = -params.width / 2 + i * hole_spacing
-                y_pos = 0
-
-                with BuildSketch(Plane.XY.offset(params.thickness / 2)):
-                    with Locations((x_pos, y_pos)):
-                        Circle(params.hole_diameter / 2)
+            # Create mounting holes (one sketch, one boolean)
+            with BuildSketch(Plane.XY.offset(params.thickness / 2)):
+                with Locations(*plan.hole_centers):
+                    Circle(params.hole_diameter / 2)
 
-                extrude(amount=-params.thickness, mode=Mode.SUBTRACT)
+            extrude(amount=-params.thickness, mode=Mode.SUBTRACT)
 
         return bracket.part
 
+    # Bracket type -> 3D generator (bracket_type is validated to these keys)
+    _DISPATCH: ClassVar[dict[str, Callable[..., Part]]] = {
+        "L": _generate_l_bracket_3d,
+        "flat": _generate_flat_bracket_3d,
+    }
+
     def generate_2d(self, params: MountingBracketParams) -> Drawing:
         """Generate 2D drawing with AS 1100 layout.
 
@@ -117,22 +300,22 @@ class MountingBracketTemplate(BaseTemplate):
             params: Mounting bracket parameters
 
         Returns:
-            ezdxf Drawing with AS 1100 compliant layout
+            New ezdxf Drawing with AS 1100 compliant layout (owned by the caller)
         """
+        return self._build_2d(params, self.prepare(params))
+
+    def _build_2d(self, params: MountingBracketParams, plan: _Plan) -> Drawing:
+        """Build 2D drawing from the precomputed plan."""
         # Create new DXF document (AS 1100 uses A4 landscape = 297x210mm)
-        doc = new("R2010", setup=True)
+        doc = new("R2010", setup=_DXF_SETUP)
         msp = doc.modelspace()
 
-        # AS 1100.101 line thickness standards (mm)
-        # Visible outlines: 0.5mm, Hidden lines: 0.25mm, Dimension lines: 0.25mm
-        doc.layers.add("OUTLINE", color=7, linetype="CONTINUOUS")  # White, solid
-        doc.layers.add("HIDDEN", color=8, linetype="DASHED")  # Grey, dashed
-        doc.layers.add("DIMENSIONS", color=3, linetype="CONTINUOUS")  # Green, solid
-        doc.layers.add("TEXT", color=7, linetype="CONTINUOUS")  # White, solid
+        for name, color, linetype in plan.layers:
+            doc.layers.add(name, color=color, linetype=linetype)
 
         # Draw front view (looking at vertical plate for L-bracket)
         front_view_origin = (50, 150)  # Offset from border
-        self._draw_front_view(msp, params, front_view_origin)
+        self._draw_front_view(msp, params, plan, front_view_origin)
 
         # Draw side view
         side_view_origin = (200, 150)
@@ -142,37 +325,30 @@ class MountingBracketTemplate(BaseTemplate):
         self._add_title_block(doc, msp, params)
 
         # Add dimensions
-        self._add_dimensions(msp, params, front_view_origin, side_view_origin)
+        self._add_dimensions(msp, params, plan, front_view_origin, side_view_origin)
 
         return doc
 
     def _draw_front_view(
-        self, msp, params: MountingBracketParams, origin: tuple[float, float]
+        self, msp, params: MountingBracketParams, plan: _Plan, origin: tuple[float, float]
     ) -> None:
         """Draw front view of bracket."""
         x0, y0 = origin
 
         # Draw outline rectangle (vertical plate)
         msp.add_lwpolyline(
-            [
-                (x0, y0),
-                (x0 + params.width, y0),
-                (x0 + params.width, y0 + params.height),
-                (x0, y0 + params.height),
-                (x0, y0),
-            ],
-            dxfattribs={"layer": "OUTLINE"},
+            _rectangle(x0, y0, params.width, params.height), dxfattribs={"layer": "OUTLINE"}
         )
 
-        # Draw mounting holes
-        hole_spacing = params.width / (params.hole_count + 1)
-        for i in range(1, params.hole_count + 1):
-            x_center = x0 + i * hole_spacing
-            y_center = y0 + params.height / 2
-            msp.add_circle(
-                (x_center, y_center),
-                radius=params.hole_diameter / 2,
-                dxfattribs={"layer": "OUTLINE"},
+        # Draw mounting holes - create entities directly (add_circle only copies
+        # and normalizes dxfattribs before delegating to new_entity)
+        x_mid = x0 + params.width / 2
+        y_center = y0 + params.height / 2
+        radius = params.hole_diameter / 2
+        for hole_x in plan.hole_xs:
+            msp.new_entity(
+                "CIRCLE",
+                {"center": Vec3(x_mid + hole_x, y_center), "radius": radius, "layer": "OUTLINE"},
             )
 
     def _draw_side_view(
@@ -183,20 +359,14 @@ class MountingBracketTemplate(BaseTemplate):
 
         # Draw thickness rectangle
         msp.add_lwpolyline(
-            [
-                (x0, y0),
-                (x0 + params.thickness, y0),
-                (x0 + params.thickness, y0 + params.height),
-                (x0, y0 + params.height),
-                (x0, y0),
-            ],
-            dxfattribs={"layer": "OUTLINE"},
+            _rectangle(x0, y0, params.thickness, params.height), dxfattribs={"layer": "OUTLINE"}
         )
 
     def _add_dimensions(
         self,
         msp,
         params: MountingBracketParams,
+        plan: _Plan,
         front_origin: tuple[float, float],
         side_origin: tuple[float, float],
     ) -> None:
@@ -223,7 +393,7 @@ class MountingBracketTemplate(BaseTemplate):
         )
 
         # Hole diameter dimension (leader to first hole)
-        hole_x = x0 + params.width / (params.hole_count + 1)
+        hole_x = x0 + params.width / 2 + plan.hole_xs[0]
         hole_y = y0 + params.height / 2
         msp.add_text(
             f"Ø{params.hole_diameter}",
@@ -236,61 +406,24 @@ class MountingBracketTemplate(BaseTemplate):
 
     def _add_title_block(self, doc: Drawing, msp, params: MountingBracketParams) -> None:
         """Add simplified AS 1100 title block."""
-        # AS 1100.101 title block location: bottom right corner
-        # A4 landscape: 297x210mm, border 20mm left, 10mm others
-        # Title block typically 170mm wide x 50mm high
-
-        title_x = 297 - 170 - 10  # Right aligned with 10mm margin
-        title_y = 10  # Bottom aligned with 10mm margin
-
         # Draw title block border
-        msp.add_lwpolyline(
-            [
-                (title_x, title_y),
-                (title_x + 170, title_y),
-                (title_x + 170, title_y + 50),
-                (title_x, title_y + 50),
-                (title_x, title_y),
-            ],
-            dxfattribs={"layer": "OUTLINE"},
-        )
+        msp.add_lwpolyline(_TITLE_BLOCK_POINTS, dxfattribs={"layer": "OUTLINE"})
 
-        # Add title text
-        msp.add_text(
-            f"MOUNTING BRACKET - {params.bracket_type.upper()}",
-            dxfattribs={
-                "layer": "TEXT",
-                "height": 5,  # Title text larger
-                "insert": (title_x + 5, title_y + 35),
-            },
-        )
-
-        # Add material specification
-        msp.add_text(
+        # Add title block text as one MTEXT entity (one entity to build and
+        # serialize instead of one TEXT per line); \P is the MTEXT line break
+        lines = [
+            # Title text larger
+            f"{{\\H5;MOUNTING BRACKET - {params.bracket_type.upper()}}}",
             f"MATERIAL: {params.material}",
-            dxfattribs={
-                "layer": "TEXT",
-                "height": 3.5,
-                "insert": (title_x + 5, title_y + 25),
-            },
-        )
-
-        # Add dimensions summary
-        msp.add_text(
             f"{params.width}x{params.height}x{params.thickness}mm",
-            dxfattribs={
-                "layer": "TEXT",
-                "height": 3.5,
-                "insert": (title_x + 5, title_y + 15),
-            },
-        )
-
-        # Add hole specification
-        msp.add_text(
             f"{params.hole_count}x Ø{params.hole_diameter}mm HOLES",
+        ]
+        msp.add_mtext(
+            "\\P".join(lines),
             dxfattribs={
                 "layer": "TEXT",
-                "height": 3.5,
-                "insert": (title_x + 5, title_y + 5),
+                "char_height": 3.5,  # AS 1100.101 minimum text height 3.5mm
+                "attachment_point": MTextEntityAlignment.BOTTOM_LEFT,
+                "insert": (_TITLE_X + 5, _TITLE_Y + 5),
             },
         )
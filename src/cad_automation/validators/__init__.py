@@ -1,7 +1,14 @@
 """AS 1100 compliance validators for CAD drawings."""
 
-from .base import BaseValidator, ValidationResult
+from .base import BaseValidator, ValidationResult, entities_by_type, query_cached
 from .dimensioning import DimensioningValidator
 from .sheet_layout import SheetLayoutValidator
 
-__all__ = ["BaseValidator", "ValidationResult", "DimensioningValidator", "SheetLayoutValidator"]
+__all__ = [
+    "BaseValidator",
+    "ValidationResult",
+    "DimensioningValidator",
+    "SheetLayoutValidator",
+    "entities_by_type",
+    "query_cached",
+]
@@ -2,13 +2,105 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from weakref import WeakSet
 
 from ezdxf.document import Drawing
 
+# Drawing attribute holding the per-drawing entity cache. It lives on the
+# drawing itself rather than in a module-level WeakKeyDictionary: cached
+# entities reference their drawing, so a dictionary value would keep its
+# weak key alive forever.
+_CACHE_ATTR = "_validator_entity_cache"
 
-@dataclass
+# Drawings currently carrying an entity cache, so clear_cache() can reach them.
+_cached_drawings: "WeakSet[Drawing]" = WeakSet()
+
+
+@dataclass(slots=True)
+class _EntityCache:
+    """Modelspace lookups shared by all validators for one drawing.
+
+    Attributes:
+        entities: Live modelspace entities when the cache was built
+        queries: Query string -> matching entities
+        by_type: DXF type -> entities, built on first use
+    """
+
+    entities: tuple
+    queries: dict[str, list] = field(default_factory=dict)
+    by_type: dict[str, list] | None = None
+
+
+def _entity_cache(drawing: Drawing) -> _EntityCache:
+    """Get the drawing's entity cache, rebuilding it if the modelspace changed.
+
+    The cache is keyed on the identity of every live modelspace entity, so
+    adding, deleting or replacing entities all invalidate it.
+
+    Args:
+        drawing: ezdxf Drawing object
+
+    Returns:
+        Entity cache valid for the current modelspace content
+    """
+    entities = tuple(drawing.modelspace())
+    cache = getattr(drawing, _CACHE_ATTR, None)
+    if cache is None or cache.entities != entities:
+        cache = _EntityCache(entities)
+        setattr(drawing, _CACHE_ATTR, cache)
+        _cached_drawings.add(drawing)
+    return cache
+
+
+def query_cached(drawing: Drawing, query: str) -> list:
+    """Query modelspace entities, reusing results across validators.
+
+    Each query is evaluated once per modelspace state: results are rebuilt
+    when entities are added, deleted or replaced. Attribute filters
+    (``[...]``) are evaluated on every call, since in-place attribute edits
+    do not invalidate the cache.
+
+    Args:
+        drawing: ezdxf Drawing object
+        query: ezdxf entity query string (e.g. "DIMENSION")
+
+    Returns:
+        List of matching entities (shared - do not modify)
+    """
+    if "[" in query:
+        return list(drawing.modelspace().query(query))
+
+    results = _entity_cache(drawing).queries
+    if query not in results:
+        results[query] = list(drawing.modelspace().query(query))
+    return results[query]
+
+
+def entities_by_type(drawing: Drawing) -> dict[str, list]:
+    """Group modelspace entities by DXF type, reusing the index across validators.
+
+    The modelspace is grouped once per modelspace state; afterwards looking
+    up all entities of a type is a dict access. The index is rebuilt when
+    entities are added, deleted or replaced.
+
+    Args:
+        drawing: ezdxf Drawing object
+
+    Returns:
+        Dict mapping DXF type (e.g. "LINE") to entities (shared - do not modify)
+    """
+    cache = _entity_cache(drawing)
+    if cache.by_type is None:
+        by_type: dict[str, list] = {}
+        for entity in cache.entities:
+            by_type.setdefault(entity.dxftype(), []).append(entity)
+        cache.by_type = by_type
+    return cache.by_type
+
+
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
-    """Result of a validation check.
+    """Result of a validation check (immutable).
 
     Attributes:
         passed: Whether validation passed overall
@@ -27,8 +119,8 @@ class ValidationResult:
     checks_passed: int = 0
 
     def __post_init__(self):
-        """Validate score is in valid range."""
-        if not 0.0 <= self.score <= 1.0:
+        """Validate score is in valid range (skipped under python -O)."""
+        if __debug__ and not 0.0 <= self.score <= 1.0:
             raise ValueError(f"Score must be between 0.0 and 1.0, got {self.score}")
 
 
@@ -71,6 +163,13 @@ class BaseValidator(ABC):
         """
         pass
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop the entity caches shared by all validators, for every drawing."""
+        for drawing in list(_cached_drawings):
+            vars(drawing).pop(_CACHE_ATTR, None)
+        _cached_drawings.clear()
+
     def __repr__(self) -> str:
         """String representation of validator."""
         return f"{self.__class__.__name__}(weight={self.weight}, standard='{self.standard}')"
@@ -7,9 +7,10 @@ Validates:
 - Decimal places consistency
 """
 
+import numpy as np
 from ezdxf.document import Drawing
 
-from .base import BaseValidator, ValidationResult
+from .base import BaseValidator, ValidationResult, query_cached
 
 # AS 1100.101 dimensioning standards
 AS1100_MIN_TEXT_HEIGHT = 3.5  # mm
@@ -23,6 +24,38 @@ AS1100_STANDARD_ARROW_SIZE = 0.75  # mm (3x 0.25mm)
 TOLERANCE = 0.5  # mm
 
 
+def _extract_dimstyle_values(dimensions: list) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Extract text height, arrow size and decimal places in a single pass.
+
+    Per-entity overrides are stored in XDATA rather than as DXF attributes,
+    so values are read through each dimension's override, which falls back
+    to the entity's dimstyle.
+
+    Args:
+        dimensions: List of DIMENSION entities
+
+    Returns:
+        Tuple of (text_heights, arrow_sizes, decimal_places) arrays
+    """
+    values = []
+    for dim in dimensions:
+        override = dim.override()
+        values.append(
+            (
+                override.get("dimtxt", 3.5),  # Default to 3.5mm
+                override.get("dimasz", AS1100_STANDARD_ARROW_SIZE),
+                override.get("dimdec", 2),  # Default to 2 decimal places
+            )
+        )
+
+    text_heights, arrow_sizes, decimal_places = zip(*values)
+    return (
+        np.array(text_heights, dtype=np.float64),
+        np.array(arrow_sizes, dtype=np.float64),
+        np.array(decimal_places, dtype=np.int64),
+    )
+
+
 class DimensioningValidator(BaseValidator):
     """Validator for AS 1100.101 dimensioning requirements.
 
@@ -53,10 +86,8 @@ class DimensioningValidator(BaseValidator):
         checks_performed = 0
         checks_passed = 0
 
-        msp = drawing.modelspace()
-
         # Get all dimension entities
-        dimensions = list(msp.query("DIMENSION"))
+        dimensions = query_cached(drawing, "DIMENSION")
 
         if len(dimensions) == 0:
             warnings.append("No dimension entities found - cannot validate dimensioning standards")
@@ -69,9 +100,11 @@ class DimensioningValidator(BaseValidator):
                 checks_passed=1,
             )
 
+        text_heights, arrow_sizes, decimal_places = _extract_dimstyle_values(dimensions)
+
         # Check 1: Validate dimension text height
         checks_performed += 1
-        text_height_check = self._validate_text_height(dimensions)
+        text_height_check = self._validate_text_height(text_heights)
         if text_height_check["passed"]:
             checks_passed += 1
         else:
@@ -80,19 +113,17 @@ class DimensioningValidator(BaseValidator):
 
         # Check 2: Validate arrow size
         checks_performed += 1
-        arrow_size_check = self._validate_arrow_size(dimensions)
+        arrow_size_check = self._validate_arrow_size(arrow_sizes)
         if arrow_size_check["passed"]:
             checks_passed += 1
-        else:
-            warnings.extend(arrow_size_check.get("warnings", []))
+        warnings.extend(arrow_size_check.get("warnings", []))
 
         # Check 3: Check for decimal consistency
         checks_performed += 1
-        decimal_check = self._validate_decimal_consistency(dimensions)
+        decimal_check = self._validate_decimal_consistency(decimal_places)
         if decimal_check["passed"]:
             checks_passed += 1
-        else:
-            warnings.extend(decimal_check.get("warnings", []))
+        warnings.extend(decimal_check.get("warnings", []))
 
         # Calculate score
         score = checks_passed / checks_performed if checks_performed > 0 else 0.0
@@ -107,66 +138,48 @@ class DimensioningValidator(BaseValidator):
             checks_passed=checks_passed,
         )
 
-    def _validate_text_height(self, dimensions: list) -> dict:
+    def _validate_text_height(self, text_heights: np.ndarray) -> dict:
         """Validate dimension text height meets AS 1100 minimum.
 
         Args:
-            dimensions: List of DIMENSION entities
+            text_heights: Text height (dimtxt) of each dimension in mm
 
         Returns:
             Dict with 'passed' bool, 'errors' and 'warnings' lists
         """
         errors = []
         warnings = []
-        violations = []
-
-        for dim in dimensions:
-            try:
-                # Get text height from dimension style or override
-                text_height = dim.dxf.get("dimtxt", 3.5)  # Default to 3.5mm
 
-                if text_height < AS1100_MIN_TEXT_HEIGHT - TOLERANCE:
-                    violations.append(text_height)
-            except (AttributeError, KeyError):
-                continue
+        violations = text_heights[text_heights < AS1100_MIN_TEXT_HEIGHT - TOLERANCE]
 
-        if violations:
-            avg_height = sum(violations) / len(violations)
+        if violations.size:
+            avg_height = float(violations.mean())
             errors.append(
-                f"Dimension text height too small: {len(violations)} dimensions "
+                f"Dimension text height too small: {violations.size} dimensions "
                 f"below {AS1100_MIN_TEXT_HEIGHT}mm minimum (avg: {avg_height:.2f}mm). "
                 f"AS 1100.101 requires minimum {AS1100_MIN_TEXT_HEIGHT}mm text height."
             )
             return {"passed": False, "errors": errors, "warnings": warnings}
 
         warnings.append(
-            f"Dimension text height: {len(dimensions)} dimensions checked, "
+            f"Dimension text height: {text_heights.size} dimensions checked, "
             f"all meet {AS1100_MIN_TEXT_HEIGHT}mm minimum"
         )
         return {"passed": True, "errors": errors, "warnings": warnings}
 
-    def _validate_arrow_size(self, dimensions: list) -> dict:
+    def _validate_arrow_size(self, arrow_sizes: np.ndarray) -> dict:
         """Validate arrow size follows AS 1100 standards.
 
         Args:
-            dimensions: List of DIMENSION entities
+            arrow_sizes: Arrow size (dimasz) of each dimension in mm
 
         Returns:
             Dict with 'passed' bool and 'warnings' list
         """
         warnings = []
-        arrow_sizes = []
-
-        for dim in dimensions:
-            try:
-                # Get arrow size from dimension style
-                arrow_size = dim.dxf.get("dimasz", AS1100_STANDARD_ARROW_SIZE)
-                arrow_sizes.append(arrow_size)
-            except (AttributeError, KeyError):
-                continue
-
-        if arrow_sizes:
-            avg_arrow = sum(arrow_sizes) / len(arrow_sizes)
+
+        if arrow_sizes.size:
+            avg_arrow = float(arrow_sizes.mean())
             expected = AS1100_STANDARD_ARROW_SIZE
 
             if abs(avg_arrow - expected) > TOLERANCE:
@@ -177,47 +190,38 @@ class DimensioningValidator(BaseValidator):
                 )
             else:
                 warnings.append(
-                    f"Arrow size: avg {avg_arrow:.2f}mm ({len(arrow_sizes)} dimensions), "
+                    f"Arrow size: avg {avg_arrow:.2f}mm ({arrow_sizes.size} dimensions), "
                     f"meets AS 1100 standard (~{expected}mm)"
                 )
 
         return {"passed": True, "warnings": warnings}
 
-    def _validate_decimal_consistency(self, dimensions: list) -> dict:
+    def _validate_decimal_consistency(self, decimal_places: np.ndarray) -> dict:
         """Check decimal place consistency in dimension text.
 
         Args:
-            dimensions: List of DIMENSION entities
+            decimal_places: Decimal places (dimdec) of each dimension
 
         Returns:
             Dict with 'passed' bool and 'warnings' list
         """
         warnings = []
-        decimal_places = []
-
-        for dim in dimensions:
-            try:
-                # Get decimal places setting
-                dec_places = dim.dxf.get("dimdec", 2)  # Default to 2 decimal places
-                decimal_places.append(dec_places)
-            except (AttributeError, KeyError):
-                continue
 
-        if decimal_places:
+        if decimal_places.size:
             # Check if all dimensions use consistent decimal places
-            unique_decimals = set(decimal_places)
+            unique_decimals = np.unique(decimal_places)
 
-            if len(unique_decimals) > 1:
+            if unique_decimals.size > 1:
                 warnings.append(
-                    f"Inconsistent decimal places: {len(unique_decimals)} different "
-                    f"settings found {sorted(unique_decimals)}. "
+                    f"Inconsistent decimal places: {unique_decimals.size} different "
+                    f"settings found {unique_decimals.tolist()}. "
                     f"AS 1100.101 recommends consistent decimal precision."
                 )
                 return {"passed": False, "warnings": warnings}
 
             warnings.append(
-                f"Decimal places: consistent across {len(decimal_places)} dimensions "
-                f"({decimal_places[0]} decimal places)"
+                f"Decimal places: consistent across {decimal_places.size} dimensions "
+                f"({int(decimal_places[0])} decimal places)"
             )
 
         return {"passed": True, "warnings": warnings}
@@ -7,24 +7,34 @@ Validates:
 """
 
 
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import NamedTuple
+
+import numpy as np
 from ezdxf.document import Drawing
 
-from .base import BaseValidator, ValidationResult
-
-# AS 1100.101 standard sheet sizes in mm (width x height)
-AS1100_SHEET_SIZES: dict[str, tuple[float, float]] = {
-    "A0": (1189.0, 841.0),
-    "A1": (841.0, 594.0),
-    "A2": (594.0, 420.0),
-    "A3": (420.0, 297.0),
-    "A4": (297.0, 210.0),
-    # Landscape orientations
-    "A0L": (841.0, 1189.0),
-    "A1L": (594.0, 841.0),
-    "A2L": (420.0, 594.0),
-    "A3L": (297.0, 420.0),
-    "A4L": (210.0, 297.0),
-}
+from .base import BaseValidator, ValidationResult, entities_by_type
+
+# AS 1100.101 standard sheet sizes in mm (width x height), read-only
+AS1100_SHEET_SIZES: Mapping[str, tuple[float, float]] = MappingProxyType(
+    {
+        "A0": (1189.0, 841.0),
+        "A1": (841.0, 594.0),
+        "A2": (594.0, 420.0),
+        "A3": (420.0, 297.0),
+        "A4": (297.0, 210.0),
+        # Landscape orientations
+        "A0L": (841.0, 1189.0),
+        "A1L": (594.0, 841.0),
+        "A2L": (420.0, 594.0),
+        "A3L": (297.0, 420.0),
+        "A4L": (210.0, 297.0),
+    }
+)
 
 # AS 1100.101 border dimensions in mm
 AS1100_BORDER_LEFT = 20.0  # Left border (binding edge)
@@ -32,6 +42,172 @@ AS1100_BORDER_OTHERS = 10.0  # Top, right, bottom borders
 
 # Tolerance for dimension checks (mm)
 TOLERANCE = 1.0  # ±1mm tolerance for border checks
+_TOLERANCE_SQ = TOLERANCE * TOLERANCE
+
+# Sheet sizes as parallel columns so every size is matched in one
+# vectorised comparison
+_SIZE_NAMES: tuple[str, ...] = tuple(AS1100_SHEET_SIZES)
+_SIZE_WIDTHS = np.array([w for w, _ in AS1100_SHEET_SIZES.values()], dtype=np.float64)
+_SIZE_HEIGHTS = np.array([h for _, h in AS1100_SHEET_SIZES.values()], dtype=np.float64)
+
+
+@lru_cache(maxsize=64)
+def _lookup_sheet_size(width: float, height: float) -> str | None:
+    """Match a sheet size against the AS 1100 sizes (memoized).
+
+    Drawings in a batch share a handful of sheet sizes, so repeat lookups
+    are a single cache probe.
+
+    Args:
+        width: Sheet width in mm
+        height: Sheet height in mm
+
+    Returns:
+        Sheet size name (e.g., "A4") if within TOLERANCE, None otherwise
+    """
+    dw = _SIZE_WIDTHS - width
+    dh = _SIZE_HEIGHTS - height
+    mask = (dw * dw <= _TOLERANCE_SQ) & (dh * dh <= _TOLERANCE_SQ)
+    matches = np.flatnonzero(mask)
+    return _SIZE_NAMES[matches[0]] if matches.size else None
+
+
+# Entity types treated as border candidates and title block text
+_BORDER_TYPES = frozenset({"LWPOLYLINE", "LINE"})
+_TEXT_TYPES = frozenset({"TEXT", "MTEXT"})
+
+
+def _insert_points(entities: Iterable) -> Iterator[tuple[float, float]]:
+    """Yield the (x, y) insertion point of each entity that has one.
+
+    Args:
+        entities: DXF entities
+
+    Yields:
+        Insertion point coordinates in mm
+    """
+    for entity in entities:
+        try:
+            insert = entity.dxf.insert
+        except AttributeError:  # insert not set and no default
+            continue
+        yield insert.x, insert.y
+
+
+class _SubResult(NamedTuple):
+    """Outcome of a single sheet layout check.
+
+    Attributes:
+        passed: Whether the check passed
+        message: Human-readable outcome
+        is_warning: Report a failure as a warning rather than an error
+    """
+
+    passed: bool
+    message: str
+    is_warning: bool = False
+
+
+# Failed check outcomes do not depend on the drawing, so build them once
+_NO_BORDERS = _SubResult(
+    passed=False,
+    message="No border entities found. AS 1100.101 requires borders "
+    f"({AS1100_BORDER_LEFT}mm left, {AS1100_BORDER_OTHERS}mm others)",
+    is_warning=True,
+)
+_NO_TITLE_BLOCK = _SubResult(
+    passed=False,
+    message="Title block not found in bottom-right corner. "
+    "AS 1100.101 requires title block with drawing info",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _TitleRegion:
+    """Bottom-right sheet region where the title block is expected.
+
+    Attributes:
+        x_min: Left edge of the region in mm
+        y_max: Top edge of the region in mm
+    """
+
+    x_min: float
+    y_max: float
+
+    @classmethod
+    def for_sheet(cls, width: float, height: float) -> "_TitleRegion":
+        """Region covering the right 40% and bottom 30% of a sheet.
+
+        Args:
+            width: Sheet width in mm
+            height: Sheet height in mm
+
+        Returns:
+            Title block region for the sheet
+        """
+        return cls(x_min=width * 0.6, y_max=height * 0.3)
+
+    def contains(self, x, y):
+        """Test whether points lie inside the region.
+
+        Works element-wise when given numpy arrays.
+
+        Args:
+            x: X coordinate(s) in mm
+            y: Y coordinate(s) in mm
+
+        Returns:
+            bool, or boolean array for array input
+        """
+        return (x >= self.x_min) & (y <= self.y_max)
+
+
+class _DrawingSummary(NamedTuple):
+    """Everything the sheet layout checks need from a drawing.
+
+    Attributes:
+        width: Sheet width in mm
+        height: Sheet height in mm
+        border_count: Number of LWPOLYLINE/LINE border candidates
+        title_text_count: Number of TEXT/MTEXT entities in the title block region
+    """
+
+    width: float
+    height: float
+    border_count: int
+    title_text_count: int
+
+
+def _scan_drawing(drawing: Drawing, width: float, height: float) -> _DrawingSummary:
+    """Count layout entities in one go.
+
+    Entities come from the shared per-drawing type index; an empty
+    modelspace skips the lookups entirely.
+
+    Args:
+        drawing: ezdxf Drawing object
+        width: Sheet width in mm
+        height: Sheet height in mm
+
+    Returns:
+        Summary of sheet size and entity counts
+    """
+    if len(drawing.modelspace()) == 0:
+        return _DrawingSummary(width, height, 0, 0)
+
+    index = entities_by_type(drawing)
+    border_count = sum(len(index.get(dxftype, ())) for dxftype in _BORDER_TYPES)
+
+    # Title block should be in bottom-right corner - hit-test all text
+    # insert points against that region at once
+    texts = chain.from_iterable(index.get(dxftype, ()) for dxftype in _TEXT_TYPES)
+    points = np.fromiter(_insert_points(texts), dtype=np.dtype((np.float64, 2)))
+    title_text_count = 0
+    if points.size:
+        region = _TitleRegion.for_sheet(width, height)
+        title_text_count = int(region.contains(points[:, 0], points[:, 1]).sum())
+
+    return _DrawingSummary(width, height, border_count, title_text_count)
 
 
 class SheetLayoutValidator(BaseValidator):
@@ -45,7 +221,7 @@ class SheetLayoutValidator(BaseValidator):
     Weight: 15% of overall compliance score
     """
 
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize sheet layout validator."""
         super().__init__(weight=0.15, name="Sheet Layout Validator", standard="AS 1100.101")
 
@@ -81,6 +257,9 @@ class SheetLayoutValidator(BaseValidator):
                 checks_passed=0,
             )
 
+        # Count layout entities up front (single scan)
+        summary = _scan_drawing(drawing, width, height)
+
         # Check 1: Validate sheet size
         checks_performed += 1
         sheet_size = self._validate_sheet_size(width, height)
@@ -96,27 +275,27 @@ class SheetLayoutValidator(BaseValidator):
 
         # Check 2: Validate borders (check for border entities)
         checks_performed += 1
-        border_check = self._validate_borders(drawing, width, height)
-        if border_check["passed"]:
+        border_check = self._validate_borders(summary)
+        if border_check.passed:
             checks_passed += 1
         else:
-            if border_check.get("warning"):
-                warnings.append(border_check["message"])
+            if border_check.is_warning:
+                warnings.append(border_check.message)
             else:
-                errors.append(border_check["message"])
+                errors.append(border_check.message)
 
         # Check 3: Validate title block presence
         checks_performed += 1
-        title_block_check = self._validate_title_block(drawing, width, height)
-        if title_block_check["passed"]:
+        title_block_check = self._validate_title_block(summary)
+        if title_block_check.passed:
             checks_passed += 1
         else:
             # Title block is a warning, not critical error for POC
-            warnings.append(title_block_check["message"])
+            warnings.append(title_block_check.message)
 
-        # Calculate score
-        score = checks_passed / checks_performed if checks_performed > 0 else 0.0
-        passed = len(errors) == 0 and score >= 0.8  # 80% threshold for passing
+        # Calculate score (all three checks always run once limits are known)
+        score = checks_passed / checks_performed
+        passed = not errors and score >= 0.8  # 80% threshold for passing
 
         return ValidationResult(
             passed=passed,
@@ -137,85 +316,43 @@ class SheetLayoutValidator(BaseValidator):
         Returns:
             Sheet size name (e.g., "A4") if valid, None otherwise
         """
-        for size_name, (std_width, std_height) in AS1100_SHEET_SIZES.items():
-            if abs(width - std_width) <= TOLERANCE and abs(height - std_height) <= TOLERANCE:
-                return size_name
-        return None
+        return _lookup_sheet_size(width, height)
 
-    def _validate_borders(self, drawing: Drawing, width: float, height: float) -> dict:
+    def _validate_borders(self, summary: _DrawingSummary) -> _SubResult:
         """Check for border entities (simplified check).
 
+        AS 1100 borders should be rectangles near the sheet edges; this only
+        checks that LWPOLYLINE/LINE entities exist.
+
         Args:
-            drawing: ezdxf Drawing object
-            width: Sheet width in mm
-            height: Sheet height in mm
+            summary: Scanned drawing summary
 
         Returns:
-            Dict with 'passed' bool and 'message' str
+            _SubResult with passed flag and message
         """
-        msp = drawing.modelspace()
-
-        # Look for polyline/line entities that could be borders
-        # AS 1100 borders should be rectangles near the sheet edges
-        border_entities = []
-
-        for entity in msp.query("LWPOLYLINE LINE"):
-            border_entities.append(entity)
-
-        if len(border_entities) == 0:
-            return {
-                "passed": False,
-                "message": "No border entities found. AS 1100.101 requires borders "
-                f"({AS1100_BORDER_LEFT}mm left, {AS1100_BORDER_OTHERS}mm others)",
-                "warning": True,
-            }
+        if summary.border_count == 0:
+            return _NO_BORDERS
 
         # Simplified check: just verify borders exist
         # Full implementation would check exact border dimensions
-        return {
-            "passed": True,
-            "message": f"Border entities found ({len(border_entities)} lines/polylines)",
-        }
+        return _SubResult(
+            passed=True,
+            message=f"Border entities found ({summary.border_count} lines/polylines)",
+        )
 
-    def _validate_title_block(self, drawing: Drawing, width: float, height: float) -> dict:
+    def _validate_title_block(self, summary: _DrawingSummary) -> _SubResult:
         """Check for title block presence (simplified check).
 
         Args:
-            drawing: ezdxf Drawing object
-            width: Sheet width in mm
-            height: Sheet height in mm
+            summary: Scanned drawing summary
 
         Returns:
-            Dict with 'passed' bool and 'message' str
+            _SubResult with passed flag and message
         """
-        msp = drawing.modelspace()
-
-        # Title block should be in bottom-right corner
-        # Look for text entities in that region
-        title_block_region_x = width * 0.6  # Right 40% of drawing
-        title_block_region_y = height * 0.3  # Bottom 30% of drawing
-
-        title_text_entities = []
-        for entity in msp.query("TEXT MTEXT"):
-            try:
-                insert = entity.dxf.insert if hasattr(entity.dxf, "insert") else None
-                if (
-                    insert
-                    and insert[0] >= title_block_region_x
-                    and insert[1] <= title_block_region_y
-                ):
-                    title_text_entities.append(entity)
-            except AttributeError:
-                continue
-
-        if len(title_text_entities) == 0:
-            return {
-                "passed": False,
-                "message": "Title block not found in bottom-right corner. "
-                "AS 1100.101 requires title block with drawing info",
-            }
-
-        return {
-            "passed": True,
-            "message": f"Title block found ({len(title_text_entities)} text entities in bottom-right region)",
-        }
+        if summary.title_text_count == 0:
+            return _NO_TITLE_BLOCK
+
+        return _SubResult(
+            passed=True,
+            message=f"Title block found ({summary.title_text_count} text entities in bottom-right region)",
+        )
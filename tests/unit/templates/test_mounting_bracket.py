@@ -1,14 +1,20 @@
 """Unit tests for mounting bracket template."""
 
+import math
+import shutil
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
+import ezdxf
 import pytest
 from build123d import Part
 from cad_automation.templates.mounting_bracket import (
     MountingBracketParams,
     MountingBracketTemplate,
 )
+from pydantic import ValidationError
 
 
 class TestMountingBracketParams:
@@ -55,31 +61,76 @@ class TestMountingBracketParams:
                 hole_count=20,  # Max is 10
             )
 
+    def test_bracket_type_normalized(self):
+        """Test bracket type is accepted case-insensitively and normalized."""
+        base = {"width": 100.0, "height": 80.0, "thickness": 5.0, "hole_diameter": 8.0}
+        assert MountingBracketParams(**base, hole_count=4, bracket_type="l").bracket_type == "L"
+        assert (
+            MountingBracketParams(**base, hole_count=4, bracket_type="FLAT").bracket_type == "flat"
+        )
+
+    def test_invalid_bracket_type(self):
+        """Test unknown bracket type raises validation error."""
+        with pytest.raises(ValueError):
+            MountingBracketParams(
+                width=100.0,
+                height=80.0,
+                thickness=5.0,
+                hole_diameter=8.0,
+                hole_count=4,
+                bracket_type="U",
+            )
+
+    def test_params_frozen(self):
+        """Test parameters are immutable and hashable."""
+        params = MountingBracketParams(
+            width=100.0, height=80.0, thickness=5.0, hole_diameter=8.0, hole_count=4
+        )
+        with pytest.raises(ValidationError):
+            params.width = 200.0
+        assert hash(params) == hash(params.model_copy())
+        assert {params: "cached"}[params.model_copy()] == "cached"
+
+    def test_import_does_not_load_build123d(self):
+        """Test build123d is only imported when 3D generation is used."""
+        code = (
+            "import sys\n"
+            "from cad_automation.templates.mounting_bracket import MountingBracketParams\n"
+            "assert 'build123d' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.fixture(scope="session")
+def params():
+    """L-bracket parameters shared by all tests (immutable)."""
+    return MountingBracketParams(
+        width=100.0,
+        height=80.0,
+        thickness=5.0,
+        hole_diameter=8.0,
+        hole_count=4,
+        material="Steel",
+        bracket_type="L",
+    )
+
 
 class TestMountingBracketTemplate:
     """Test mounting bracket 3D/2D generation."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.template = MountingBracketTemplate()
-        self.params = MountingBracketParams(
-            width=100.0,
-            height=80.0,
-            thickness=5.0,
-            hole_diameter=8.0,
-            hole_count=4,
-            material="Steel",
-            bracket_type="L",
-        )
+    @pytest.fixture
+    def template(self):
+        """Fresh template per test so cached output never leaks between tests."""
+        return MountingBracketTemplate()
 
-    def test_generate_3d_l_bracket(self):
+    def test_generate_3d_l_bracket(self, template, params):
         """Test 3D L-bracket generation."""
-        part = self.template.generate_3d(self.params)
+        part = template.generate_3d(params)
         assert isinstance(part, Part)
         # Verify part has volume (not empty)
         assert part.volume > 0
 
-    def test_generate_3d_flat_bracket(self):
+    def test_generate_3d_flat_bracket(self, template):
         """Test 3D flat bracket generation."""
         params = MountingBracketParams(
             width=100.0,
@@ -90,13 +141,13 @@ class TestMountingBracketTemplate:
             material="Steel",
             bracket_type="flat",
         )
-        part = self.template.generate_3d(params)
+        part = template.generate_3d(params)
         assert isinstance(part, Part)
         assert part.volume > 0
 
-    def test_generate_2d(self):
+    def test_generate_2d(self, template, params):
         """Test 2D drawing generation."""
-        drawing = self.template.generate_2d(self.params)
+        drawing = template.generate_2d(params)
         # Verify drawing has modelspace
         assert drawing.modelspace() is not None
         # Verify layers exist
@@ -104,27 +155,27 @@ class TestMountingBracketTemplate:
         assert "DIMENSIONS" in drawing.layers
         assert "TEXT" in drawing.layers
 
-    def test_export_step(self):
+    def test_export_step(self, template, params):
         """Test STEP export."""
-        part = self.template.generate_3d(self.params)
+        part = template.generate_3d(params)
         with tempfile.TemporaryDirectory() as tmpdir:
             output_path = Path(tmpdir) / "test_bracket.step"
-            self.template.export_step(part, output_path)
+            template.export_step(part, output_path)
             assert output_path.exists()
             assert output_path.stat().st_size > 0
 
-    def test_export_dxf(self):
+    def test_export_dxf(self, template, params):
         """Test DXF export."""
-        drawing = self.template.generate_2d(self.params)
+        drawing = template.generate_2d(params)
         with tempfile.TemporaryDirectory() as tmpdir:
             output_path = Path(tmpdir) / "test_bracket.dxf"
-            self.template.export_dxf(drawing, output_path)
+            template.export_dxf(drawing, output_path)
             assert output_path.exists()
             assert output_path.stat().st_size > 0
 
-    def test_parametric_variation_width(self):
+    def test_parametric_variation_width(self, template, params):
         """Test that changing width parameter affects output."""
-        part1 = self.template.generate_3d(self.params)
+        part1 = template.generate_3d(params)
         volume1 = part1.volume
 
         params2 = MountingBracketParams(
@@ -136,15 +187,15 @@ class TestMountingBracketTemplate:
             material="Steel",
             bracket_type="L",
         )
-        part2 = self.template.generate_3d(params2)
+        part2 = template.generate_3d(params2)
         volume2 = part2.volume
 
         # Volume should increase with width
         assert volume2 > volume1
 
-    def test_parametric_variation_thickness(self):
+    def test_parametric_variation_thickness(self, template, params):
         """Test that changing thickness parameter affects output."""
-        part1 = self.template.generate_3d(self.params)
+        part1 = template.generate_3d(params)
         volume1 = part1.volume
 
         params2 = MountingBracketParams(
@@ -156,8 +207,144 @@ class TestMountingBracketTemplate:
             material="Steel",
             bracket_type="L",
         )
-        part2 = self.template.generate_3d(params2)
+        part2 = template.generate_3d(params2)
         volume2 = part2.volume
 
         # Volume should increase with thickness
         assert volume2 > volume1
+
+    def test_generate_3d_cached(self, template, params):
+        """Test identical parameters return the cached part."""
+        part1 = template.generate_3d(params)
+        part2 = template.generate_3d(params.model_copy())
+        assert part1 is part2
+
+    def test_3d_cache_bounded(self, params):
+        """Test the part cache evicts the least recently used entry."""
+        template = MountingBracketTemplate()
+        template.cache_size = 2
+        first = template.generate_3d(params)
+        for hole_count in (2, 3):
+            template.generate_3d(params.model_copy(update={"hole_count": hole_count}))
+        assert len(template._3d_cache) == 2
+        assert template.generate_3d(params) is not first  # Evicted, regenerated
+
+    def test_generate_2d_not_shared(self, template, params):
+        """Test each call returns an independent drawing."""
+        drawing1 = template.generate_2d(params)
+        drawing2 = template.generate_2d(params.model_copy())
+        assert drawing1 is not drawing2
+
+        drawing1.modelspace().add_line((0, 0), (10, 0))
+        assert len(drawing2.modelspace()) == len(drawing1.modelspace()) - 1
+
+    def test_holes_subtracted(self, template, params):
+        """Test every mounting hole removes material from the flat bracket."""
+        volumes = []
+        for hole_count in (1, 4):
+            flat = params.model_copy(update={"bracket_type": "flat", "hole_count": hole_count})
+            volumes.append(template.generate_3d(flat).volume)
+        assert volumes[1] < volumes[0]
+
+    def test_export_step_compact(self, template, params):
+        """Test compact STEP export is smaller than the default export."""
+        part = template.generate_3d(params)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            default_path = Path(tmpdir) / "default.step"
+            compact_path = Path(tmpdir) / "compact.step"
+            template.export_step(part, default_path)
+            template.export_step(part, compact_path, compact=True)
+            assert compact_path.exists()
+            assert 0 < compact_path.stat().st_size < default_path.stat().st_size
+            # AP203 files declare the CONFIG_CONTROL_DESIGN schema
+            assert "CONFIG_CONTROL_DESIGN" in compact_path.read_text()
+
+    def test_export_dxf_roundtrip(self, template, params):
+        """Test exported DXF reads back with the same layers and entities."""
+        drawing = template.generate_2d(params)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test_bracket.dxf"
+            template.export_dxf(drawing, output_path)
+            loaded = ezdxf.readfile(output_path)
+        assert "OUTLINE" in loaded.layers
+        assert len(loaded.modelspace()) == len(drawing.modelspace())
+
+    def test_hole_positions_shared_with_2d(self, template, params):
+        """Test 2D hole circles use the same positions as the 3D features."""
+        hole_xs = MountingBracketTemplate._hole_xs(params.width, params.hole_count)
+        assert hole_xs == pytest.approx((-30.0, -10.0, 10.0, 30.0))
+
+        drawing = template.generate_2d(params)
+        x_mid = 50 + params.width / 2  # Front view origin x + half width
+        centers = sorted(c.dxf.center.x - x_mid for c in drawing.modelspace().query("CIRCLE"))
+        assert centers == pytest.approx(list(hole_xs))
+
+    def test_l_bracket_volume(self, template, params):
+        """Test L-bracket is a single L profile with holes through both legs."""
+        p = params
+        leg_area = 2 * p.height * p.thickness - p.thickness**2
+        hole_volume = math.pi * (p.hole_diameter / 2) ** 2 * p.thickness
+        expected = leg_area * p.width - 2 * p.hole_count * hole_volume
+
+        part = template.generate_3d(p)
+        assert part.volume == pytest.approx(expected, rel=1e-3)
+
+    def test_export_step_bytes(self, template, params):
+        """Test in-memory STEP export returns a complete STEP file."""
+        part = template.generate_3d(params)
+        data = template.export_step_bytes(part, compact=True)
+        assert data.startswith(b"ISO-10303-21")
+        assert b"CONFIG_CONTROL_DESIGN" in data
+        assert data.rstrip().endswith(b"END-ISO-10303-21;")
+
+    def test_export_dxf_binary(self, template, params):
+        """Test binary DXF export reads back with the same entities."""
+        drawing = template.generate_2d(params)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test_bracket.dxf"
+            template.export_dxf(drawing, output_path, binary=True)
+            assert output_path.read_bytes().startswith(b"AutoCAD Binary DXF")
+            loaded = ezdxf.readfile(output_path)
+        assert len(loaded.modelspace()) == len(drawing.modelspace())
+
+    def test_prepare_cached(self, template, params):
+        """Test derived plan is computed once per parameter set."""
+        plan = template.prepare(params)
+        assert template.prepare(params.model_copy()) is plan
+        assert len(plan.hole_xs) == params.hole_count
+        assert len(plan.hole_centers) == params.hole_count
+        assert [name for name, _, _ in plan.layers] == ["OUTLINE", "HIDDEN", "DIMENSIONS", "TEXT"]
+
+    def test_export_dxf_leaves_no_temp_file(self, template, params):
+        """Test DXF export replaces the target atomically without leftovers."""
+        drawing = template.generate_2d(params)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "nested" / "test_bracket.dxf"
+            template.export_dxf(drawing, output_path)
+            template.export_dxf(drawing, output_path)  # Overwrite existing file
+            assert [p.name for p in output_path.parent.iterdir()] == ["test_bracket.dxf"]
+
+    def test_export_dxf_recreates_deleted_directory(self, template, params):
+        """Test export succeeds after the cached output directory is deleted."""
+        drawing = template.generate_2d(params)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "nested" / "test_bracket.dxf"
+            template.export_dxf(drawing, output_path)
+            shutil.rmtree(output_path.parent)
+
+            template.export_dxf(drawing, output_path)
+            assert output_path.exists()
+            assert [p.name for p in output_path.parent.iterdir()] == ["test_bracket.dxf"]
+
+    def test_title_block_single_mtext(self, template, params):
+        """Test title block text is emitted as a single MTEXT entity."""
+        drawing = template.generate_2d(params)
+        mtexts = list(drawing.modelspace().query("MTEXT"))
+        assert len(mtexts) == 1
+        lines = mtexts[0].plain_text().splitlines()
+        assert lines == [
+            "MOUNTING BRACKET - L",
+            "MATERIAL: Steel",
+            "100.0x80.0x5.0mm",
+            "4x Ø8.0mm HOLES",
+        ]
@@ -0,0 +1,15 @@
+"""Shared fixtures for validator tests."""
+
+import pytest
+from ezdxf import new
+from ezdxf.document import Drawing
+
+
+@pytest.fixture
+def dim_doc() -> Drawing:
+    """Fresh R2010 drawing with only the dimension styles loaded.
+
+    Dimension rendering needs the default dimstyles but none of the
+    linetypes or text styles a full ``setup=True`` creates.
+    """
+    return new("R2010", setup=["dimstyles"])
@@ -1,7 +1,17 @@
 """Unit tests for base validator classes."""
 
+import gc
+import weakref
+from dataclasses import FrozenInstanceError
+
 import pytest
-from cad_automation.validators.base import BaseValidator, ValidationResult
+from cad_automation.validators.base import (
+    BaseValidator,
+    ValidationResult,
+    entities_by_type,
+    query_cached,
+)
+from ezdxf import new
 
 
 class TestValidationResult:
@@ -34,6 +44,13 @@ class TestValidationResult:
         with pytest.raises(ValueError, match="Score must be between 0.0 and 1.0"):
             ValidationResult(passed=False, score=-0.1, errors=[], warnings=[])
 
+    def test_immutable(self) -> None:
+        """Test that results are frozen and slotted."""
+        result = ValidationResult(passed=True, score=1.0)
+        with pytest.raises(FrozenInstanceError):
+            result.score = 0.5  # type: ignore[misc]
+        assert not hasattr(result, "__dict__")
+
     def test_default_lists(self) -> None:
         """Test that errors and warnings default to empty lists."""
         result = ValidationResult(passed=True, score=1.0)
@@ -90,3 +107,131 @@ class TestBaseValidator:
         assert "DummyValidator" in repr_str
         assert "0.15" in repr_str
         assert "AS 1100.101" in repr_str
+
+
+class TestQueryCached:
+    """Test per-drawing entity query cache."""
+
+    def test_reuses_query_result(self) -> None:
+        """Test repeated queries on the same drawing return the cached list."""
+        doc = new("R2010")
+        doc.modelspace().add_line((0, 0), (10, 0))
+
+        first = query_cached(doc, "LINE")
+        assert len(first) == 1
+        assert query_cached(doc, "LINE") is first
+
+    def test_refreshes_when_entities_added(self) -> None:
+        """Test cached results are rebuilt after modelspace changes."""
+        doc = new("R2010")
+        msp = doc.modelspace()
+        msp.add_line((0, 0), (10, 0))
+        assert len(query_cached(doc, "LINE")) == 1
+
+        msp.add_line((0, 10), (10, 10))
+        assert len(query_cached(doc, "LINE")) == 2
+
+    def test_separate_drawings(self) -> None:
+        """Test results are not shared between drawings."""
+        doc1 = new("R2010")
+        doc2 = new("R2010")
+        doc1.modelspace().add_line((0, 0), (10, 0))
+
+        assert len(query_cached(doc1, "LINE")) == 1
+        assert query_cached(doc2, "LINE") == []
+
+    def test_refreshes_when_entity_replaced(self) -> None:
+        """Test deleting and adding an entity invalidates at the same entity count."""
+        doc = new("R2010")
+        msp = doc.modelspace()
+        line = msp.add_line((0, 0), (10, 0))
+        assert len(query_cached(doc, "LINE")) == 1
+
+        msp.delete_entity(line)
+        msp.add_circle((0, 0), 5)
+        assert query_cached(doc, "LINE") == []
+        assert len(query_cached(doc, "CIRCLE")) == 1
+
+    def test_attribute_filter_sees_in_place_edits(self) -> None:
+        """Test attribute-filtered queries are not served from the cache."""
+        doc = new("R2010")
+        line = doc.modelspace().add_line((0, 0), (10, 0), dxfattribs={"layer": "A"})
+        assert len(query_cached(doc, 'LINE[layer=="A"]')) == 1
+
+        line.dxf.layer = "B"
+        assert query_cached(doc, 'LINE[layer=="A"]') == []
+
+    def test_drawing_released(self) -> None:
+        """Test the cache does not keep the drawing alive."""
+        doc = new("R2010")
+        doc.modelspace().add_line((0, 0), (10, 0))
+        query_cached(doc, "LINE")
+
+        ref = weakref.ref(doc)
+        del doc
+        gc.collect()
+        assert ref() is None
+
+
+class TestEntitiesByType:
+    """Test per-drawing entity type index."""
+
+    def test_groups_by_dxftype(self) -> None:
+        """Test entities are grouped by DXF type and the index is reused."""
+        doc = new("R2010")
+        msp = doc.modelspace()
+        msp.add_line((0, 0), (10, 0))
+        msp.add_line((0, 10), (10, 10))
+        msp.add_text("NOTE")
+
+        index = entities_by_type(doc)
+        assert len(index["LINE"]) == 2
+        assert len(index["TEXT"]) == 1
+        assert "MTEXT" not in index
+        assert entities_by_type(doc) is index
+
+    def test_refreshes_when_entities_added(self) -> None:
+        """Test the index is rebuilt after modelspace changes."""
+        doc = new("R2010")
+        msp = doc.modelspace()
+        assert entities_by_type(doc) == {}
+
+        msp.add_circle((0, 0), 5)
+        assert len(entities_by_type(doc)["CIRCLE"]) == 1
+
+    def test_refreshes_when_entity_replaced(self) -> None:
+        """Test deleting and adding an entity invalidates at the same entity count."""
+        doc = new("R2010")
+        msp = doc.modelspace()
+        polyline = msp.add_lwpolyline([(0, 0), (10, 0), (10, 10)])
+        assert len(entities_by_type(doc)["LWPOLYLINE"]) == 1
+
+        msp.delete_entity(polyline)
+        msp.add_circle((0, 0), 5)
+        index = entities_by_type(doc)
+        assert "LWPOLYLINE" not in index
+        assert len(index["CIRCLE"]) == 1
+
+    def test_shares_cache_with_queries(self) -> None:
+        """Test the index and query results are invalidated together."""
+        doc = new("R2010")
+        msp = doc.modelspace()
+        msp.add_line((0, 0), (10, 0))
+        lines = query_cached(doc, "LINE")
+        index = entities_by_type(doc)
+
+        msp.add_text("NOTE")
+        assert query_cached(doc, "LINE") is not lines
+        assert entities_by_type(doc) is not index
+
+    def test_clear_cache(self) -> None:
+        """Test clear_cache drops the index and query results."""
+        doc = new("R2010")
+        doc.modelspace().add_line((0, 0), (10, 0))
+        lines = query_cached(doc, "LINE")
+        index = entities_by_type(doc)
+
+        BaseValidator.clear_cache()
+        assert query_cached(doc, "LINE") is not lines
+        assert entities_by_type(doc) is not index
+        assert entities_by_type(doc) == index
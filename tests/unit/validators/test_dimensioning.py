@@ -3,7 +3,21 @@
 from cad_automation.validators.dimensioning import (
     DimensioningValidator,
 )
-from ezdxf import new
+from ezdxf.document import Drawing
+
+VALID_OVERRIDE = {"dimtxt": 3.5, "dimasz": 0.75, "dimdec": 2}
+
+
+def _add_dimensions(doc: Drawing, overrides: list[dict]) -> None:
+    """Add and render one stacked linear dimension per override dict."""
+    msp = doc.modelspace()
+    for i, override in enumerate(overrides):
+        msp.add_linear_dim(
+            base=(50 + i * 20, 20),
+            p1=(10, 10 + i * 10),
+            p2=(90, 10 + i * 10),
+            override=override,
+        ).render()
 
 
 class TestDimensioningValidator:
@@ -19,92 +33,61 @@ class TestDimensioningValidator:
         assert self.validator.name == "Dimensioning Validator"
         assert self.validator.standard == "AS 1100.101"
 
-    def test_no_dimensions_passes(self) -> None:
+    def test_no_dimensions_passes(self, dim_doc: Drawing) -> None:
         """Test validation passes when no dimensions present."""
-        doc = new("R2010", setup=True)
-
-        result = self.validator.validate(doc)
+        result = self.validator.validate(dim_doc)
 
         assert result.passed is True
         assert result.score == 1.0
         assert len(result.errors) == 0
         assert any("No dimension entities" in warning for warning in result.warnings)
 
-    def test_valid_dimensions(self) -> None:
+    def test_valid_dimensions(self, dim_doc: Drawing) -> None:
         """Test validation of compliant dimensions."""
-        doc = new("R2010", setup=True)
-        msp = doc.modelspace()
-
         # Add dimension with valid properties using override
-        dim_override = msp.add_linear_dim(
-            base=(50, 20),
-            p1=(10, 10),
-            p2=(90, 10),
-            override={"dimtxt": 3.5, "dimasz": 0.75, "dimdec": 2},
-        )
-        dim_override.render()
+        _add_dimensions(dim_doc, [VALID_OVERRIDE])
 
-        result = self.validator.validate(doc)
+        result = self.validator.validate(dim_doc)
 
         assert result.passed is True
         assert result.score >= 0.7
         assert len(result.errors) == 0
         assert result.checks_performed == 3
 
-    def test_text_height_too_small(self) -> None:
+    def test_text_height_too_small(self, dim_doc: Drawing) -> None:
         """Test validation fails for text height below minimum."""
-        doc = new("R2010", setup=True)
-        msp = doc.modelspace()
-
-        # Add dimension with text too small
-        dim_override = msp.add_linear_dim(
-            base=(50, 20),
-            p1=(10, 10),
-            p2=(90, 10),
-            override={"dimtxt": 2.0, "dimasz": 0.75, "dimdec": 2},
-        )
-        dim_override.render()
+        _add_dimensions(dim_doc, [{**VALID_OVERRIDE, "dimtxt": 2.0}])
 
-        result = self.validator.validate(doc)
+        result = self.validator.validate(dim_doc)
 
         assert result.passed is False
         assert result.score < 1.0
         assert any("text height too small" in error.lower() for error in result.errors)
 
-    def test_multiple_dimensions_text_height(self) -> None:
-        """Test validation with multiple dimensions."""
-        doc = new("R2010", setup=True)
-        msp = doc.modelspace()
+    def test_tolerance_in_text_height(self, dim_doc: Drawing) -> None:
+        """Test that tolerance is applied to text height checks."""
+        # Text height slightly below minimum but within tolerance
+        _add_dimensions(dim_doc, [{**VALID_OVERRIDE, "dimtxt": 3.2}])
+
+        result = self.validator.validate(dim_doc)
+
+        # Should pass because within tolerance
+        assert len(result.errors) == 0
 
-        # Add multiple dimensions
-        for i in range(3):
-            dim_override = msp.add_linear_dim(
-                base=(50 + i * 20, 20),
-                p1=(10, 10 + i * 10),
-                p2=(90, 10 + i * 10),
-                override={"dimtxt": 3.5, "dimasz": 0.75, "dimdec": 2},
-            )
-            dim_override.render()
+    def test_multiple_dimensions_text_height(self, dim_doc: Drawing) -> None:
+        """Test validation with multiple dimensions."""
+        _add_dimensions(dim_doc, [VALID_OVERRIDE] * 3)
 
-        result = self.validator.validate(doc)
+        result = self.validator.validate(dim_doc)
 
         assert result.passed is True
         assert any("3 dimensions checked" in warning for warning in result.warnings)
 
-    def test_arrow_size_warning(self) -> None:
+    def test_arrow_size_warning(self, dim_doc: Drawing) -> None:
         """Test warning for non-standard arrow size."""
-        doc = new("R2010", setup=True)
-        msp = doc.modelspace()
-
-        dim_override = msp.add_linear_dim(
-            base=(50, 20),
-            p1=(10, 10),
-            p2=(90, 10),
-            override={"dimtxt": 3.5, "dimasz": 2.0, "dimdec": 2},
-        )
-        dim_override.render()
+        _add_dimensions(dim_doc, [{**VALID_OVERRIDE, "dimasz": 2.0}])
 
-        result = self.validator.validate(doc)
+        result = self.validator.validate(dim_doc)
 
         # Should still pass but with warning
         assert result.passed is True
@@ -113,22 +96,12 @@ class TestDimensioningValidator:
             for warning in result.warnings
         )
 
-    def test_decimal_consistency_pass(self) -> None:
+    def test_decimal_consistency_pass(self, dim_doc: Drawing) -> None:
         """Test validation passes with consistent decimal places."""
-        doc = new("R2010", setup=True)
-        msp = doc.modelspace()
-
         # All dimensions use 2 decimal places
-        for i in range(3):
-            dim_override = msp.add_linear_dim(
-                base=(50 + i * 20, 20),
-                p1=(10, 10 + i * 10),
-                p2=(90, 10 + i * 10),
-                override={"dimtxt": 3.5, "dimasz": 0.75, "dimdec": 2},
-            )
-            dim_override.render()
+        _add_dimensions(dim_doc, [VALID_OVERRIDE] * 3)
 
-        result = self.validator.validate(doc)
+        result = self.validator.validate(dim_doc)
 
         assert result.passed is True
         assert any(
@@ -136,83 +109,35 @@ class TestDimensioningValidator:
             for warning in result.warnings
         )
 
-    def test_decimal_consistency_fail(self) -> None:
+    def test_decimal_consistency_fail(self, dim_doc: Drawing) -> None:
         """Test validation warns about inconsistent decimal places."""
-        doc = new("R2010", setup=True)
-        msp = doc.modelspace()
-
         # Mix of decimal places
-        for i, dec_places in enumerate([2, 3, 2]):
-            dim_override = msp.add_linear_dim(
-                base=(50 + i * 20, 20),
-                p1=(10, 10 + i * 10),
-                p2=(90, 10 + i * 10),
-                override={"dimtxt": 3.5, "dimasz": 0.75, "dimdec": dec_places},
-            )
-            dim_override.render()
+        _add_dimensions(dim_doc, [{**VALID_OVERRIDE, "dimdec": dec} for dec in (2, 3, 2)])
 
-        result = self.validator.validate(doc)
+        result = self.validator.validate(dim_doc)
 
         # Should still pass overall but warn about inconsistency
         assert result.score < 1.0  # One check failed
         assert any("inconsistent decimal" in warning.lower() for warning in result.warnings)
 
-    def test_score_calculation(self) -> None:
+    def test_score_calculation(self, dim_doc: Drawing) -> None:
         """Test score calculation with mixed results."""
-        doc = new("R2010", setup=True)
-        msp = doc.modelspace()
-
         # Add dimension that passes text height but has warnings
-        dim_override = msp.add_linear_dim(
-            base=(50, 20),
-            p1=(10, 10),
-            p2=(90, 10),
-            override={"dimtxt": 3.5, "dimasz": 2.0, "dimdec": 2},
-        )
-        dim_override.render()
+        _add_dimensions(dim_doc, [{**VALID_OVERRIDE, "dimasz": 2.0}])
 
-        result = self.validator.validate(doc)
+        result = self.validator.validate(dim_doc)
 
         # Score should be checks_passed / checks_performed
         expected_score = result.checks_passed / result.checks_performed
         assert result.score == expected_score
         assert 0.0 <= result.score <= 1.0
 
-    def test_tolerance_in_text_height(self) -> None:
-        """Test that tolerance is applied to text height checks."""
-        doc = new("R2010", setup=True)
-        msp = doc.modelspace()
-
-        # Text height slightly below minimum but within tolerance
-        dim_override = msp.add_linear_dim(
-            base=(50, 20),
-            p1=(10, 10),
-            p2=(90, 10),
-            override={"dimtxt": 3.2, "dimasz": 0.75, "dimdec": 2},
-        )
-        dim_override.render()
-
-        result = self.validator.validate(doc)
-
-        # Should pass because within tolerance
-        assert len(result.errors) == 0
-
-    def test_multiple_violations(self) -> None:
+    def test_multiple_violations(self, dim_doc: Drawing) -> None:
         """Test multiple text height violations."""
-        doc = new("R2010", setup=True)
-        msp = doc.modelspace()
-
         # Add multiple dimensions with small text
-        for i in range(5):
-            dim_override = msp.add_linear_dim(
-                base=(50 + i * 20, 20),
-                p1=(10, 10 + i * 10),
-                p2=(90, 10 + i * 10),
-                override={"dimtxt": 2.0, "dimasz": 0.75, "dimdec": 2},
-            )
-            dim_override.render()
-
-        result = self.validator.validate(doc)
+        _add_dimensions(dim_doc, [{**VALID_OVERRIDE, "dimtxt": 2.0}] * 5)
+
+        result = self.validator.validate(dim_doc)
 
         assert result.passed is False
         # Should report 5 violations
@@ -1,57 +1,86 @@
 """Unit tests for SheetLayoutValidator."""
 
+import numpy as np
+import pytest
 from cad_automation.validators.sheet_layout import (
     AS1100_BORDER_LEFT,
     AS1100_BORDER_OTHERS,
     AS1100_SHEET_SIZES,
     SheetLayoutValidator,
+    _insert_points,
+    _lookup_sheet_size,
+    _scan_drawing,
+    _TitleRegion,
 )
 from ezdxf import new
+from ezdxf.document import Drawing
+
+# Simplified A4 landscape border - a closed rectangle inside the AS 1100 margins
+_A4_BORDER_POINTS = (
+    (AS1100_BORDER_LEFT, AS1100_BORDER_OTHERS),
+    (297 - AS1100_BORDER_OTHERS, AS1100_BORDER_OTHERS),
+    (297 - AS1100_BORDER_OTHERS, 210 - AS1100_BORDER_OTHERS),
+    (AS1100_BORDER_LEFT, 210 - AS1100_BORDER_OTHERS),
+    (AS1100_BORDER_LEFT, AS1100_BORDER_OTHERS),
+)
+
+
+@pytest.fixture(scope="module")
+def validator() -> SheetLayoutValidator:
+    """Validator shared by the module (it keeps no per-instance state)."""
+    return SheetLayoutValidator()
+
+
+@pytest.fixture
+def doc() -> Drawing:
+    """Fresh drawing with the sheet origin at (0, 0); tests set $LIMMAX.
+
+    No template setup - the validator only reads header limits and
+    modelspace entities, never linetypes, text styles or dimstyles.
+    """
+    doc = new("R2010")
+    doc.header["$LIMMIN"] = (0, 0)
+    return doc
+
+
+def _build_a4(
+    doc: Drawing,
+    *,
+    border: bool = True,
+    title: bool = True,
+    limmax: tuple[float, float] = (297, 210),
+) -> Drawing:
+    """Set up an A4 landscape sheet with an optional border and title block text."""
+    doc.header["$LIMMAX"] = limmax
+    msp = doc.modelspace()
+    if border:
+        msp.add_lwpolyline(_A4_BORDER_POINTS, dxfattribs={"layer": "BORDER"})
+    if title:
+        # Title block text in bottom-right corner
+        msp.add_text(
+            "DRAWING TITLE",
+            dxfattribs={"layer": "TEXT", "height": 5, "insert": (200, 20)},
+        )
+    return doc
 
 
 class TestSheetLayoutValidator:
     """Test AS 1100.101 sheet layout validation."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.validator = SheetLayoutValidator()
-
-    def test_validator_properties(self) -> None:
+    def test_validator_properties(self, validator: SheetLayoutValidator) -> None:
         """Test validator has correct properties."""
-        assert self.validator.weight == 0.15
-        assert self.validator.name == "Sheet Layout Validator"
-        assert self.validator.standard == "AS 1100.101"
+        assert validator.weight == 0.15
+        assert validator.name == "Sheet Layout Validator"
+        assert validator.standard == "AS 1100.101"
 
-    def test_valid_a4_landscape_drawing(self) -> None:
+    def test_valid_a4_landscape_drawing(
+        self, validator: SheetLayoutValidator, doc: Drawing
+    ) -> None:
         """Test validation of compliant A4 landscape drawing."""
-        # Create A4 landscape drawing (297x210mm)
-        doc = new("R2010", setup=True)
-        doc.header["$LIMMIN"] = (0, 0)
-        doc.header["$LIMMAX"] = (297, 210)
-
-        msp = doc.modelspace()
+        # Create A4 landscape drawing (297x210mm) with border and title block
+        _build_a4(doc)
 
-        # Add border (simplified - just a rectangle)
-        border_points = [
-            (AS1100_BORDER_LEFT, AS1100_BORDER_OTHERS),
-            (297 - AS1100_BORDER_OTHERS, AS1100_BORDER_OTHERS),
-            (297 - AS1100_BORDER_OTHERS, 210 - AS1100_BORDER_OTHERS),
-            (AS1100_BORDER_LEFT, 210 - AS1100_BORDER_OTHERS),
-            (AS1100_BORDER_LEFT, AS1100_BORDER_OTHERS),
-        ]
-        msp.add_lwpolyline(border_points, dxfattribs={"layer": "BORDER"})
-
-        # Add title block text in bottom-right corner
-        msp.add_text(
-            "DRAWING TITLE",
-            dxfattribs={
-                "layer": "TEXT",
-                "height": 5,
-                "insert": (200, 20),  # Bottom-right region
-            },
-        )
-
-        result = self.validator.validate(doc)
+        result = validator.validate(doc)
 
         assert result.passed is True
         assert result.score >= 0.8  # At least 80% passing
@@ -59,33 +88,29 @@ class TestSheetLayoutValidator:
         assert result.checks_performed == 3
         assert result.checks_passed >= 2  # Sheet size + borders minimum
 
-    def test_valid_a3_drawing(self) -> None:
+    def test_valid_a3_drawing(self, validator: SheetLayoutValidator, doc: Drawing) -> None:
         """Test validation of A3 sheet size."""
-        doc = new("R2010", setup=True)
-        doc.header["$LIMMIN"] = (0, 0)
         doc.header["$LIMMAX"] = (420, 297)  # A3
 
         msp = doc.modelspace()
         msp.add_lwpolyline([(20, 10), (410, 10), (410, 287), (20, 287), (20, 10)])
 
-        result = self.validator.validate(doc)
+        result = validator.validate(doc)
 
         assert "A3" in str(result.warnings)  # Sheet size mentioned in warnings
         assert result.score > 0  # Some checks should pass
 
-    def test_invalid_sheet_size(self) -> None:
+    def test_invalid_sheet_size(self, validator: SheetLayoutValidator, doc: Drawing) -> None:
         """Test validation fails for non-standard sheet size."""
-        doc = new("R2010", setup=True)
-        doc.header["$LIMMIN"] = (0, 0)
         doc.header["$LIMMAX"] = (500, 500)  # Invalid size
 
-        result = self.validator.validate(doc)
+        result = validator.validate(doc)
 
         assert result.passed is False
         assert result.score < 1.0
         assert any("Invalid sheet size" in error for error in result.errors)
 
-    def test_missing_drawing_limits(self) -> None:
+    def test_missing_drawing_limits(self, validator: SheetLayoutValidator) -> None:
         """Test validation fails gracefully when limits are missing."""
         doc = new("R2010")  # Don't use setup=True to avoid default limits
         # Explicitly delete drawing limits if they exist
@@ -95,86 +120,177 @@ class TestSheetLayoutValidator:
         except KeyError:
             pass
 
-        result = self.validator.validate(doc)
+        result = validator.validate(doc)
 
         assert result.passed is False
         assert result.score == 0.0
         assert any("Drawing limits" in error for error in result.errors)
 
-    def test_missing_borders(self) -> None:
-        """Test warning when no border entities found."""
-        doc = new("R2010", setup=True)
-        doc.header["$LIMMIN"] = (0, 0)
-        doc.header["$LIMMAX"] = (297, 210)  # A4
+    def test_scan_errors_not_reported_as_missing_limits(
+        self, validator: SheetLayoutValidator, doc: Drawing, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test errors from the entity scan propagate instead of failing the limits check."""
+
+        def broken_index(drawing: Drawing) -> dict:
+            raise KeyError("index")
 
+        monkeypatch.setattr("cad_automation.validators.sheet_layout.entities_by_type", broken_index)
+        with pytest.raises(KeyError, match="index"):
+            validator.validate(_build_a4(doc))
+
+    def test_missing_borders(self, validator: SheetLayoutValidator, doc: Drawing) -> None:
+        """Test warning when no border entities found."""
         # Don't add any border entities
+        _build_a4(doc, border=False, title=False)
 
-        result = self.validator.validate(doc)
+        result = validator.validate(doc)
 
         # Should warn about missing borders but not fail (warning only)
         assert any("border" in warning.lower() for warning in result.warnings)
 
-    def test_missing_title_block(self) -> None:
+    def test_missing_title_block(self, validator: SheetLayoutValidator, doc: Drawing) -> None:
         """Test warning when title block not found."""
-        doc = new("R2010", setup=True)
-        doc.header["$LIMMIN"] = (0, 0)
-        doc.header["$LIMMAX"] = (297, 210)  # A4
-
-        msp = doc.modelspace()
         # Add border but no title block
-        msp.add_lwpolyline([(20, 10), (287, 10), (287, 200), (20, 200), (20, 10)])
+        _build_a4(doc, title=False)
 
-        result = self.validator.validate(doc)
+        result = validator.validate(doc)
 
         # Should warn about missing title block
         assert any("title block" in warning.lower() for warning in result.warnings)
 
-    def test_all_standard_sheet_sizes(self) -> None:
+    @pytest.mark.parametrize(
+        ("size_name", "width", "height"),
+        [(name, width, height) for name, (width, height) in AS1100_SHEET_SIZES.items()],
+    )
+    def test_all_standard_sheet_sizes(
+        self,
+        validator: SheetLayoutValidator,
+        doc: Drawing,
+        size_name: str,
+        width: float,
+        height: float,
+    ) -> None:
         """Test validation recognizes all AS 1100 sheet sizes."""
-        for size_name, (width, height) in AS1100_SHEET_SIZES.items():
-            doc = new("R2010", setup=True)
-            doc.header["$LIMMIN"] = (0, 0)
-            doc.header["$LIMMAX"] = (width, height)
+        doc.header["$LIMMAX"] = (width, height)
 
-            msp = doc.modelspace()
-            msp.add_lwpolyline([(20, 10), (width - 10, 10)])
+        msp = doc.modelspace()
+        msp.add_lwpolyline([(20, 10), (width - 10, 10)])
 
-            result = self.validator.validate(doc)
+        result = validator.validate(doc)
 
-            # Should recognize the sheet size (mentioned in warnings)
-            assert any(
-                size_name.replace("L", "") in str(result.warnings)
-                for warning in [str(result.warnings)]
-            ), f"Sheet size {size_name} not recognized"
+        # Should recognize the sheet size (mentioned in warnings)
+        warnings_str = str(result.warnings)
+        assert size_name.replace("L", "") in warnings_str, f"Sheet size {size_name} not recognized"
 
-    def test_score_calculation(self) -> None:
+    def test_score_calculation(self, validator: SheetLayoutValidator, doc: Drawing) -> None:
         """Test score is calculated correctly."""
-        doc = new("R2010", setup=True)
-        doc.header["$LIMMIN"] = (0, 0)
-        doc.header["$LIMMAX"] = (297, 210)  # Valid A4
+        _build_a4(doc)  # Valid A4 with border and title block
 
-        msp = doc.modelspace()
-        msp.add_lwpolyline([(20, 10), (287, 10)])  # Border
-        msp.add_text("TITLE", dxfattribs={"insert": (200, 20)})  # Title block
-
-        result = self.validator.validate(doc)
+        result = validator.validate(doc)
 
         # Score should be checks_passed / checks_performed
         expected_score = result.checks_passed / result.checks_performed
         assert result.score == expected_score
         assert 0.0 <= result.score <= 1.0
 
-    def test_tolerance_in_sheet_size(self) -> None:
+    def test_tolerance_in_sheet_size(self, validator: SheetLayoutValidator, doc: Drawing) -> None:
         """Test that small variations in sheet size are accepted (within tolerance)."""
-        doc = new("R2010", setup=True)
-        doc.header["$LIMMIN"] = (0, 0)
         # A4 is 297x210, test with 297.5x210.5 (within 1mm tolerance)
-        doc.header["$LIMMAX"] = (297.5, 210.5)
+        _build_a4(doc, title=False, limmax=(297.5, 210.5))
 
-        msp = doc.modelspace()
-        msp.add_lwpolyline([(20, 10), (287, 10)])
-
-        result = self.validator.validate(doc)
+        result = validator.validate(doc)
 
         # Should still recognize as A4
         assert "A4" in str(result.warnings)
+
+    def test_sheet_size_outside_tolerance(self, validator: SheetLayoutValidator) -> None:
+        """Test sizes just beyond the 1mm tolerance are rejected."""
+        assert validator._validate_sheet_size(297.0, 210.0) == "A4"
+        assert validator._validate_sheet_size(298.0, 209.0) == "A4"
+        assert validator._validate_sheet_size(298.4, 210.0) is None
+        assert validator._validate_sheet_size(297.0, 208.6) is None
+
+    def test_revalidation_sees_in_place_edits(
+        self, validator: SheetLayoutValidator, doc: Drawing
+    ) -> None:
+        """Test validating again reflects entities edited in place."""
+        _build_a4(doc)
+        first = validator.validate(doc)
+        assert first.score == 1.0
+
+        # Move the title text out of the bottom-right region
+        doc.modelspace().query("TEXT").first.dxf.insert = (50, 150)
+        second = validator.validate(doc)
+        assert second is not first
+        assert second.score == pytest.approx(2 / 3)
+        assert second.warnings is not first.warnings
+
+    def test_title_block_counts_only_region_texts(self, validator: SheetLayoutValidator) -> None:
+        """Test only texts in the bottom-right region count toward the title block."""
+        doc = new("R2010")
+        doc.header["$LIMMIN"] = (0, 0)
+        doc.header["$LIMMAX"] = (297, 210)
+        msp = doc.modelspace()
+        msp.add_text("TITLE", dxfattribs={"insert": (250, 20)})
+        msp.add_mtext("REV A", dxfattribs={"insert": (200, 40)})
+        msp.add_text("NOTE", dxfattribs={"insert": (50, 150)})
+
+        summary = _scan_drawing(doc, 297, 210)
+        assert summary == (297, 210, 0, 2)
+
+        result = validator._validate_title_block(summary)
+        assert result.passed is True
+        assert "(2 text entities" in result.message
+
+    def test_title_region_contains(self) -> None:
+        """Test title region hit-testing for scalars and arrays."""
+        region = _TitleRegion.for_sheet(297, 210)
+        assert region.x_min == 297 * 0.6
+        assert region.y_max == 210 * 0.3
+        assert region.contains(250, 20)
+        assert not region.contains(50, 20)
+        assert not region.contains(250, 150)
+        assert region.contains(np.array([250.0, 50.0]), np.array([20.0, 20.0])).tolist() == [
+            True,
+            False,
+        ]
+
+    def test_sheet_size_lookup_is_memoized(self, validator: SheetLayoutValidator) -> None:
+        """Test repeated sheet size lookups hit the cache."""
+        _lookup_sheet_size.cache_clear()
+        assert validator._validate_sheet_size(420.0, 297.0) == "A3"
+        assert validator._validate_sheet_size(420.0, 297.0) == "A3"
+
+        info = _lookup_sheet_size.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_insert_points_skip_entities_without_insert(self) -> None:
+        """Test entities whose insert attribute cannot be read are skipped."""
+        doc = new("R2010")
+        msp = doc.modelspace()
+        msp.add_text("TITLE", dxfattribs={"insert": (250, 20)})
+        msp.add_line((0, 0), (10, 10))  # No insert attribute - raises AttributeError
+        msp.add_mtext("REV A")  # Insert not set - falls back to the DXF default
+
+        assert list(_insert_points(msp)) == [(250.0, 20.0), (0.0, 0.0)]
+
+    def test_sheet_sizes_are_read_only(self) -> None:
+        """Test the standard sheet size table cannot be modified."""
+        with pytest.raises(TypeError):
+            AS1100_SHEET_SIZES["A5"] = (210.0, 148.0)  # type: ignore[index]
+        assert "A5" not in AS1100_SHEET_SIZES
+
+    def test_empty_modelspace(self, validator: SheetLayoutValidator) -> None:
+        """Test an empty drawing still reports sheet size, border and title block."""
+        doc = new("R2010")
+        doc.header["$LIMMIN"] = (0, 0)
+        doc.header["$LIMMAX"] = (297, 210)
+
+        result = validator.validate(doc)
+
+        assert result.checks_performed == 3
+        assert result.checks_passed == 1  # Sheet size only
+        assert result.passed is False
+        assert any("border" in warning.lower() for warning in result.warnings)
+        assert any("title block" in warning.lower() for warning in result.warnings)